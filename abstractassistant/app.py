@@ -16,6 +16,14 @@ from .core.llm_manager import LLMManager
 from .utils.icon_generator import IconGenerator
 from .config import Config
 
+# Resolved once at import instead of inside every notification handler.
+# Without a Qt binding toast_window fails with NameError rather than
+# ImportError; the guarded calls below then print to the console instead
+try:
+    from .ui.toast_window import show_toast_notification
+except Exception:
+    show_toast_notification = None
+
 
 class EnhancedClickableIcon(pystray.Icon):
     """Custom pystray Icon that handles single/double click differentiation."""
@@ -348,10 +356,12 @@ class AbstractAssistantApp:
                         debug=self.debug,
                         listening_mode=self.listening_mode
                     )
-                    self.bubble_manager.set_response_callback(self.handle_bubble_response)
-                    self.bubble_manager.set_error_callback(self.handle_bubble_error)
-                    self.bubble_manager.set_status_callback(self.update_icon_status)
-                    self.bubble_manager.set_app_quit_callback(self.quit_application)
+                    self.bubble_manager.set_callbacks(
+                        response=self.handle_bubble_response,
+                        error=self.handle_bubble_error,
+                        status=self.update_icon_status,
+                        app_quit=self.quit_application
+                    )
                     self.bubble_manager.show()
                 except Exception as e:
                     if self.debug:
@@ -500,10 +510,9 @@ class AbstractAssistantApp:
     
     def show_toast_notification(self, message: str, type: str = "info"):
         """Show a toast notification."""
-        icon = "✅" if type == "success" else "❌" if type == "error" else "ℹ️"
-        print(f"{icon} {message}")
-        
         if self.debug:
+            icon = "✅" if type == "success" else "❌" if type == "error" else "ℹ️"
+            print(f"{icon} {message}")
             print(f"Toast notification: {type} - {message}")
         
         # Show a proper macOS notification
@@ -580,9 +589,8 @@ class AbstractAssistantApp:
                     print(f"✅ Session saved to: {filepath}")
                 # Show notification
                 try:
-                    from .ui.toast_window import show_toast_notification
                     show_toast_notification(f"Session saved to:\n{filename}", debug=self.debug)
-                except:
+                except Exception:
                     print(f"💾 Session saved: {filename}")
             else:
                 if self.debug:
@@ -614,9 +622,8 @@ class AbstractAssistantApp:
                 if self.debug:
                     print("❌ No session files found")
                 try:
-                    from .ui.toast_window import show_toast_notification
                     show_toast_notification("No saved sessions found", debug=self.debug)
-                except:
+                except Exception:
                     print("📂 No saved sessions found")
                 return
             
@@ -634,9 +641,8 @@ class AbstractAssistantApp:
                     print(f"✅ Session loaded from: {filepath}")
                 # Show notification
                 try:
-                    from .ui.toast_window import show_toast_notification
                     show_toast_notification(f"Session loaded:\n{latest_session}", debug=self.debug)
-                except:
+                except Exception:
                     print(f"📂 Session loaded: {latest_session}")
             else:
                 if self.debug:
@@ -665,10 +671,12 @@ class AbstractAssistantApp:
                 )
 
                 # Set up callbacks
-                self.bubble_manager.set_response_callback(self.handle_bubble_response)
-                self.bubble_manager.set_error_callback(self.handle_bubble_error)
-                self.bubble_manager.set_status_callback(self.update_icon_status)
-                self.bubble_manager.set_app_quit_callback(self.quit_application)
+                self.bubble_manager.set_callbacks(
+                    response=self.handle_bubble_response,
+                    error=self.handle_bubble_error,
+                    status=self.update_icon_status,
+                    app_quit=self.quit_application
+                )
 
                 if self.debug:
                     print("✅ Bubble manager pre-created successfully")
@@ -727,8 +735,10 @@ class AbstractAssistantApp:
             # Create Qt-based system tray icon
             self.qt_icon = self._create_qt_system_tray_icon()
 
-            # Preflight initialization: Pre-load bubble manager for instant display
-            self._preflight_initialization()
+            # Preflight initialization: Pre-load bubble manager for instant display.
+            # Deferred to the first event loop pass so the tray icon is up first;
+            # the bubble then loads VoiceManager and providers on worker threads
+            QTimer.singleShot(0, self._preflight_initialization)
 
             print("AbstractAssistant started. Check your menu bar!")
             print("Click the icon to open the chat interface.")
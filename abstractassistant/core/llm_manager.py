@@ -90,8 +90,9 @@ class LLMManager:
             
         except Exception as e:
             print(f"❌ Error initializing LLM: {e}")
-            import traceback
-            traceback.print_exc()
+            if self.debug:
+                import traceback
+                traceback.print_exc()
             # Keep previous LLM if initialization fails
     
     def _update_token_limits_from_abstractcore(self):
@@ -5,24 +5,31 @@ This module provides an authentic iPhone Messages UI for displaying chat history
 """
 import re
 from datetime import datetime
+from importlib.util import find_spec
 from typing import Dict, List
 
-try:
+# Same binding preference as qt_bubble: the dialog's widgets must come from
+# the binding the bubble (its parent) uses
+_QT_BINDING = next((name for name in ("PyQt5", "PySide2", "PyQt6") if find_spec(name)), None)
+
+if _QT_BINDING == "PyQt5":
+    from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QScrollArea,
+                                 QWidget, QLabel, QFrame, QPushButton)
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QFont
+elif _QT_BINDING == "PySide2":
+    from PySide2.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QScrollArea,
+                                   QWidget, QLabel, QFrame, QPushButton)
+    from PySide2.QtCore import Qt
+    from PySide2.QtGui import QFont
+else:
     from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QScrollArea,
                                  QWidget, QLabel, QFrame, QPushButton)
     from PyQt6.QtCore import Qt
     from PyQt6.QtGui import QFont
-except ImportError:
-    try:
-        from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QScrollArea,
-                                     QWidget, QLabel, QFrame, QPushButton)
-        from PyQt5.QtCore import Qt
-        from PyQt5.QtGui import QFont
-    except ImportError:
-        from PySide2.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QScrollArea,
-                                       QWidget, QLabel, QFrame, QPushButton)
-        from PySide2.QtCore import Qt
-        from PySide2.QtGui import QFont
+
+# 12-hour clock used for message timestamps ("2:34 pm")
+_TIME_FMT = "%I:%M %p"
 
 
 class SafeDialog(QDialog):
@@ -289,7 +296,6 @@ class iPhoneMessagesDialog:
         timestamp_layout.setContentsMargins(16, 0, 16, 4)
 
         # Format timestamp - handle both ISO string and unix timestamp formats
-        from datetime import datetime
         timestamp = msg['timestamp']
         if isinstance(timestamp, (int, float)):
             # Convert unix timestamp to datetime
@@ -301,11 +307,11 @@ class iPhoneMessagesDialog:
         msg_date = dt.date()
 
         if msg_date == today:
-            time_str = dt.strftime("%I:%M %p").lower().lstrip('0')  # "2:34 pm"
+            time_str = dt.strftime(_TIME_FMT).lower().lstrip('0')  # "2:34 pm"
         elif (today - msg_date).days == 1:
-            time_str = f"Yesterday {dt.strftime('%I:%M %p').lower().lstrip('0')}"
+            time_str = f"Yesterday {dt.strftime(_TIME_FMT).lower().lstrip('0')}"
         else:
-            time_str = dt.strftime("%b %d, %I:%M %p").lower().replace(' 0', ' ').lstrip('0')
+            time_str = dt.strftime(f"%b %d, {_TIME_FMT}").lower().replace(' 0', ' ').lstrip('0')
 
         timestamp_label = QLabel(time_str)
         timestamp_label.setStyleSheet("""
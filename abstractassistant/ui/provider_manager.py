@@ -5,6 +5,8 @@ Handles provider discovery, model loading, and provider configuration
 using AbstractCore's provider discovery system.
 """
 
+import threading
+import time
 from typing import List, Dict, Tuple, Optional
 from abstractcore import create_llm
 from abstractcore.providers import (
@@ -48,6 +50,23 @@ class ProviderManager:
         'huggingface': ['microsoft/DialoGPT-medium', 'microsoft/DialoGPT-large']
     }
 
+    # Providers whose model list comes from a server or an API. Local backends
+    # (mlx, huggingface) load a model when instantiated, so they are never prefetched
+    PREFETCH_PROVIDERS = ('lmstudio', 'ollama', 'openai', 'anthropic')
+
+    # Seconds a discovery result is reused before asking AbstractCore again
+    DISCOVERY_TTL = 60.0
+
+    # Discovery results shared by every ProviderManager: key -> (timestamp, result)
+    _discovery_cache: Dict[Tuple, Tuple[float, list]] = {}
+
+    # Guards _discovery_cache, shared by the UI thread and the prefetch thread
+    _cache_lock = threading.Lock()
+
+    # Runs this class's AbstractCore lookups one at a time, whichever thread
+    # makes them. LLMManager creates the chat LLM outside this lock
+    _lookup_lock = threading.Lock()
+
     def __init__(self, debug: bool = False):
         """Initialize the provider manager.
 
@@ -56,6 +75,28 @@ class ProviderManager:
         """
         self.debug = debug
 
+    def _cached(self, key: Tuple) -> Optional[list]:
+        """Return a copy of a cached discovery result that is still fresh."""
+        with self._cache_lock:
+            entry = self._discovery_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.DISCOVERY_TTL:
+            if self.debug:
+                print(f"♻️  Using cached discovery result for {key}")
+            return list(entry[1])
+        return None
+
+    def _store(self, key: Tuple, result: list) -> list:
+        """Cache a discovery result and return it."""
+        with self._cache_lock:
+            self._discovery_cache[key] = (time.monotonic(), list(result))
+        return result
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget cached discovery results so the next lookup queries AbstractCore."""
+        with cls._cache_lock:
+            cls._discovery_cache.clear()
+
     def get_available_providers(self, exclude_mock: bool = True) -> List[Tuple[str, str]]:
         """Get list of available providers with display names.
 
@@ -65,9 +106,15 @@ class ProviderManager:
         Returns:
             List of (display_name, provider_key) tuples
         """
+        cache_key = ('providers', exclude_mock)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Use AbstractCore's provider discovery system
-            available_providers = list_available_providers()
+            with self._lookup_lock:
+                available_providers = list_available_providers()
 
             if self.debug:
                 print(f"🔍 Provider discovery found {len(available_providers)} available providers: {available_providers}")
@@ -90,7 +137,7 @@ class ProviderManager:
             if self.debug:
                 print(f"🔍 Total providers available: {len(providers)}")
 
-            return providers
+            return self._store(cache_key, providers)
 
         except Exception as e:
             if self.debug:
@@ -131,6 +178,22 @@ class ProviderManager:
         Returns:
             List of model names
         """
+        # Discovery results are reused for DISCOVERY_TTL; fallback lists are
+        # not cached so a provider that comes online is picked up next time
+        cache_key = ('models', provider)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+
+        with self._lookup_lock:
+            # Another thread may have fetched this provider while we waited
+            cached = self._cached(cache_key)
+            if cached is not None:
+                return cached
+            return self._discover_models(provider, cache_key)
+
+    def _discover_models(self, provider: str, cache_key: Tuple) -> List[str]:
+        """Query AbstractCore for a provider's models; called with _lookup_lock held."""
         # Strategy 1: Try provider instantiation and list_available_models()
         try:
             if self.debug:
@@ -143,7 +206,7 @@ class ProviderManager:
             if self.debug:
                 print(f"📋 Strategy 1 success: Loaded {len(models)} models for {provider}")
 
-            return models
+            return self._store(cache_key, models)
 
         except Exception as e:
             if self.debug:
@@ -159,7 +222,7 @@ class ProviderManager:
             if self.debug:
                 print(f"📋 Strategy 2 success: Loaded {len(models)} models from registry")
 
-            return models
+            return self._store(cache_key, models)
 
         except Exception as e:
             if self.debug:
@@ -176,6 +239,32 @@ class ProviderManager:
 
         return fallback_models
 
+    def prefetch_models(self, providers: List[str]):
+        """Fetch model lists for several providers, one after the other.
+
+        Only PREFETCH_PROVIDERS are fetched. Results land in the discovery
+        cache, so later get_models_for_provider calls for them return at once.
+        Each lookup takes _lookup_lock, so a UI-thread lookup waits for the
+        one in progress instead of running beside it. The chat LLM that LLMManager creates is not
+        covered by that lock; this assumes AbstractCore can build separate
+        provider instances on different threads, as the worker thread already
+        does when switching models.
+
+        Args:
+            providers: Provider keys to prefetch
+        """
+        providers = [provider for provider in providers if provider in self.PREFETCH_PROVIDERS]
+
+        if self.debug:
+            print(f"🔍 Prefetching models for: {providers}")
+
+        for provider in providers:
+            try:
+                self.get_models_for_provider(provider)
+            except Exception as e:
+                if self.debug:
+                    print(f"❌ Prefetch failed for {provider}: {e}")
+
     def create_model_display_name(self, model: str, max_length: int = 25) -> str:
         """Create a user-friendly display name for a model.
 
@@ -5,56 +5,409 @@ A simple, modern chat bubble using PyQt5/PySide2 that opens near the system tray
 """
 
 import sys
-import threading
 import time
-import json
+import queue
+import threading
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional, Callable, List, Dict
+from typing import List, Dict
 
 # Import AbstractVoice-compatible TTS manager (required dependency)
 from ..core.tts_manager import VoiceManager
+from ..utils.voice_text import clean_text_for_voice
 
 # Import our new manager classes (required dependencies)
 from .provider_manager import ProviderManager
-from .ui_styles import UIStyles
-from .tts_state_manager import TTSStateManager, TTSState
+from .tts_state_manager import TTSStateManager
 from .history_dialog import iPhoneMessagesDialog
 
-try:
+# Pick the first installed binding up front instead of failing imports in turn
+QT_AVAILABLE = next((name for name in ("PyQt5", "PySide2", "PyQt6") if find_spec(name)), None)
+
+if QT_AVAILABLE == "PyQt5":
     from PyQt5.QtWidgets import (
+        QApplication, QWidget, QVBoxLayout, QHBoxLayout,
+        QTextEdit, QPushButton, QComboBox, QLabel, QFrame,
+        QFileDialog, QMessageBox, QShortcut
+    )
+    from PyQt5.QtCore import Qt, QEvent, QTimer, pyqtSignal, QThread, pyqtSlot
+    from PyQt5.QtGui import QKeySequence
+elif QT_AVAILABLE == "PySide2":
+    from PySide2.QtWidgets import (
+        QApplication, QWidget, QVBoxLayout, QHBoxLayout,
+        QTextEdit, QPushButton, QComboBox, QLabel, QFrame,
+        QFileDialog, QMessageBox, QShortcut
+    )
+    from PySide2.QtCore import Qt, QEvent, QTimer, Signal as pyqtSignal, QThread, Slot as pyqtSlot
+    from PySide2.QtGui import QKeySequence
+elif QT_AVAILABLE == "PyQt6":
+    from PyQt6.QtWidgets import (
         QApplication, QWidget, QVBoxLayout, QHBoxLayout,
         QTextEdit, QPushButton, QComboBox, QLabel, QFrame,
         QFileDialog, QMessageBox
     )
-    from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot, QRect
-    from PyQt5.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush
-    from PyQt5.QtCore import QPoint
-    QT_AVAILABLE = "PyQt5"
-except ImportError:
-    try:
-        from PySide2.QtWidgets import (
-            QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-            QTextEdit, QPushButton, QComboBox, QLabel, QFrame,
-            QFileDialog, QMessageBox
-        )
-        from PySide2.QtCore import Qt, QTimer, Signal as pyqtSignal, QThread, Slot as pyqtSlot
-        from PySide2.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush
-        from PySide2.QtCore import QPoint
-        QT_AVAILABLE = "PySide2"
-    except ImportError:
-        try:
-            from PyQt6.QtWidgets import (
-                QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-                QTextEdit, QPushButton, QComboBox, QLabel, QFrame,
-                QFileDialog, QMessageBox
-            )
-            from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot
-            from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush
-            from PyQt6.QtCore import QPoint
-            QT_AVAILABLE = "PyQt6"
-        except ImportError:
-            QT_AVAILABLE = None
+    from PyQt6.QtCore import Qt, QEvent, QTimer, pyqtSignal, QThread, pyqtSlot
+    from PyQt6.QtGui import QKeySequence, QShortcut
+
+
+# Context size assumed until AbstractCore reports the model's real limit
+DEFAULT_MAX_TOKENS = 128000
+
+# Cursor-style theme for the chat bubble, built once at import
+BUBBLE_STYLESHEET = """
+    /* Main Window - Cursor Style */
+    QWidget {
+        background: #1e1e1e;
+        border: none;
+        border-radius: 12px;
+        color: #ffffff;
+    }
+    
+    /* Input Field - Modern Grey Design */
+    QTextEdit {
+        background: #1e1e1e;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 12px 16px;
+        font-size: 14px;
+        font-weight: 400;
+        color: #ffffff;
+        font-family: system-ui, -apple-system, sans-serif;
+        selection-background-color: #0066cc;
+        line-height: 1.4;
+    }
+    
+    QTextEdit:focus {
+        border: 1px solid #0066cc;
+        background: #252525;
+    }
+    
+    QTextEdit::placeholder {
+        color: rgba(255, 255, 255, 0.6);
+    }
+    
+    /* Buttons - Grey Theme */
+    QPushButton {
+        background: #404040;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 4px 8px;
+        font-size: 11px;
+        font-weight: 500;
+        color: #ffffff;
+        font-family: system-ui, -apple-system, sans-serif;
+    }
+    
+    QPushButton:hover {
+        background: #505050;
+        border: 1px solid #0066cc;
+    }
+    
+    QPushButton:pressed {
+        background: #353535;
+    }
+    
+    QPushButton:disabled {
+        background: #2a2a2a;
+        color: #666666;
+        border: 1px solid #333333;
+    }
+    
+    /* Dropdown Menus - Grey Theme */
+        QComboBox {
+            background: #1e1e1e;
+            border: 1px solid #404040;
+            border-radius: 6px;
+            padding: 6px 10px;
+            min-width: 80px;
+            font-size: 12px;
+            font-weight: 400;
+            color: #ffffff;
+            font-family: system-ui, -apple-system, sans-serif;
+            letter-spacing: 0.01em;
+        }
+    
+    QComboBox:hover {
+        border: 1px solid #0066cc;
+        background: #252525;
+    }
+    
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid rgba(255, 255, 255, 0.7);
+        width: 0px;
+        height: 0px;
+    }
+    
+        QComboBox QAbstractItemView {
+            background: #1a202c;
+            border: 1px solid #4a5568;
+            border-radius: 8px;
+            selection-background-color: #4299e1;
+            color: #e2e8f0;
+            padding: 4px;
+            font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display", "Segoe UI", Roboto, sans-serif;
+        }
+        
+        QComboBox QAbstractItemView::item {
+            height: 36px;
+            padding: 8px 12px;
+            border: none;
+            font-size: 12px;
+            font-weight: 400;  /* Changed from 500 to 400 (normal weight) */
+            color: #e2e8f0;
+            border-radius: 4px;
+            margin: 2px;
+        }
+        
+        QComboBox QAbstractItemView::item:selected {
+            background: #4299e1;
+            color: #ffffff;
+        }
+        
+        QComboBox QAbstractItemView::item:hover {
+            background: #374151;
+        }
+    
+    QComboBox QAbstractItemView::item:selected {
+        background: #4299e1;
+    }
+    
+    /* Labels - Clean Typography */
+    QLabel {
+        color: rgba(255, 255, 255, 0.8);
+        font-size: 12px;
+        font-weight: 500;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+        letter-spacing: 0.3px;
+    }
+    
+    /* Status Pill - switched via the "state" dynamic property */
+    QLabel#status_label {
+        background: #007acc;
+        border: none;
+        border-radius: 12px;
+        font-size: 10px;
+        font-weight: 600;
+        color: #ffffff;
+        font-family: -apple-system, system-ui, sans-serif;
+    }
+    
+    QLabel#status_label[state="ready"] {
+        background: #22c55e;
+    }
+    
+    QLabel#status_label[state="listening"] {
+        background: #ff6b35;
+    }
+    
+    QLabel#status_label[state="generating"] {
+        background: #ffa500;
+    }
+    
+    QLabel#status_label[state="error"] {
+        background: #ff3b30;
+    }
+    
+    /* Token Counter */
+    QLabel#token_label {
+        background: rgba(255, 255, 255, 0.06);
+        border: none;
+        border-radius: 14px;
+        font-size: 12px;
+        color: rgba(255, 255, 255, 0.6);
+        font-family: -apple-system, system-ui, sans-serif;
+    }
+    
+    /* Session Buttons - [active="true"] highlights the History toggle while open */
+    QPushButton#session_button {
+        background: rgba(255, 255, 255, 0.06);
+        border: none;
+        border-radius: 11px;
+        font-size: 10px;
+        color: rgba(255, 255, 255, 0.7);
+        font-family: -apple-system, system-ui, sans-serif;
+        padding: 0 10px;
+    }
+    
+    QPushButton#session_button:hover {
+        background: rgba(255, 255, 255, 0.12);
+        color: rgba(255, 255, 255, 0.9);
+    }
+    
+    QPushButton#session_button[active="true"] {
+        background: rgba(0, 122, 255, 0.8);
+        color: #ffffff;
+        font-weight: 600;
+    }
+    
+    QPushButton#session_button[active="true"]:hover {
+        background: rgba(0, 122, 255, 1.0);
+    }
+    
+    /* Close Button */
+    QPushButton#close_button {
+        background: rgba(255, 255, 255, 0.15);
+        border: none;
+        border-radius: 12px;
+        font-size: 14px;
+        font-weight: 600;
+        color: rgba(255, 255, 255, 0.9);
+        font-family: -apple-system, system-ui, sans-serif;
+    }
+    
+    QPushButton#close_button:hover {
+        background: rgba(255, 60, 60, 0.8);
+        color: #ffffff;
+    }
+    
+    /* Send Button - primary action */
+    QPushButton#send_button {
+        background: #0066cc;
+        border: 1px solid #0080ff;
+        border-radius: 20px;
+        font-size: 16px;
+        font-weight: bold;
+        color: white;
+        text-align: center;
+        padding: 0px;
+    }
+    
+    QPushButton#send_button:hover {
+        background: #0080ff;
+        border: 1px solid #0099ff;
+    }
+    
+    QPushButton#send_button:pressed {
+        background: #0052a3;
+    }
+    
+    QPushButton#send_button:disabled {
+        background: #404040;
+        color: #666666;
+        border: 1px solid #333333;
+    }
+    
+    /* Provider/Model Pills */
+    QComboBox#provider_combo, QComboBox#model_combo {
+        background: rgba(255, 255, 255, 0.08);
+        border: none;
+        border-radius: 14px;
+        padding: 0 12px;
+        font-size: 11px;
+        color: rgba(255, 255, 255, 0.9);
+        font-family: -apple-system, system-ui, sans-serif;
+    }
+    
+    QComboBox#provider_combo:hover, QComboBox#model_combo:hover {
+        background: rgba(255, 255, 255, 0.12);
+    }
+    
+    QComboBox#provider_combo::drop-down, QComboBox#model_combo::drop-down {
+        border: none;
+        width: 20px;
+    }
+    
+    QComboBox#provider_combo::down-arrow, QComboBox#model_combo::down-arrow {
+        image: none;
+        border: none;
+        width: 0px;
+    }
+    
+    /* Frames - Invisible Containers */
+    QFrame {
+        border: none;
+        background: transparent;
+    }
+    
+    /* Input Card - also applies to the text edit inside it */
+    QFrame#input_container, QFrame#input_container QFrame {
+        background: #1e1e1e;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 4px;
+    }
+    
+    /* Separator Lines */
+    QLabel#separator {
+        color: rgba(255, 255, 255, 0.3);
+        font-size: 14px;
+        font-weight: 300;
+    }
+    
+    /* Voice Control Panel */
+    QPushButton#voice_pause_button {
+        background: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 12px;
+        font-size: 12px;
+        color: rgba(255, 255, 255, 0.9);
+        font-weight: bold;
+    }
+    
+    QPushButton#voice_pause_button:hover {
+        background: rgba(255, 255, 255, 0.2);
+        border: 1px solid rgba(255, 255, 255, 0.3);
+    }
+    
+    QPushButton#voice_pause_button:pressed {
+        background: rgba(255, 255, 255, 0.05);
+    }
+    
+    QPushButton#voice_stop_button {
+        background: rgba(255, 100, 100, 0.1);
+        border: 1px solid rgba(255, 100, 100, 0.3);
+        border-radius: 12px;
+        font-size: 12px;
+        color: rgba(255, 200, 200, 0.9);
+        font-weight: bold;
+    }
+    
+    QPushButton#voice_stop_button:hover {
+        background: rgba(255, 100, 100, 0.2);
+        border: 1px solid rgba(255, 100, 100, 0.4);
+    }
+    
+    QPushButton#voice_stop_button:pressed {
+        background: rgba(255, 100, 100, 0.05);
+    }
+    
+    QLabel#voice_status_label {
+        color: rgba(255, 255, 255, 0.8);
+        font-size: 10px;
+        font-weight: 500;
+        padding: 2px 4px;
+    }
+"""
+
+
+def _toggle_stylesheet(bg_color: str, text_color: str, hover_color: str, pressed_color: str) -> str:
+    """Build the pill stylesheet shared by the TTS and Full Voice toggles."""
+    return f"""
+        QPushButton {{
+            background: {bg_color};
+            border: none;
+            border-radius: 12px;
+            font-size: 12px;
+            color: {text_color};
+            font-family: -apple-system, system-ui, sans-serif;
+            font-weight: 600;
+        }}
+        QPushButton:hover {{
+            background: {hover_color};
+        }}
+        QPushButton:pressed {{
+            background: {pressed_color};
+        }}
+    """
 
 
 class TTSToggle(QPushButton):
@@ -64,19 +417,31 @@ class TTSToggle(QPushButton):
     single_clicked = pyqtSignal()    # New signal for single click (pause/resume)
     double_clicked = pyqtSignal()    # New signal for double click (stop + chat)
 
+    # Resolved once instead of on every mouse press
+    LEFT_BUTTON = Qt.MouseButton.LeftButton
+
+    # Stylesheet per enabled state, built once at import
+    STYLESHEETS = {
+        True: _toggle_stylesheet("rgba(0, 102, 204, 0.8)", "#ffffff",
+                                 "rgba(0, 122, 255, 0.8)", "rgba(0, 122, 255, 0.6)"),
+        False: _toggle_stylesheet("rgba(255, 255, 255, 0.06)", "rgba(255, 255, 255, 0.7)",
+                                  "rgba(0, 122, 255, 0.8)", "rgba(0, 122, 255, 0.6)"),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(40, 24)  # Slightly wider for button
-        self.setToolTip("Single click: Pause/Resume TTS, Double click: Stop and open chat")
+        self.setToolTip("Click: Turn TTS on/off, Double click: Stop speech and open chat")
         self._enabled = False
+        self._emitting = False
         self.setCheckable(True)
 
-        # Click detection for single/double click
-        self._click_count = 0
-        self._click_timer = QTimer()
-        self._click_timer.setSingleShot(True)
-        self._click_timer.timeout.connect(self._handle_single_click)
-        self._double_click_interval = 300  # ms
+        # A press shows the new state at once but only applies it (emits
+        # toggled) once no double click has followed, since a double click
+        # must not toggle TTS or reset the session
+        self._toggle_timer = QTimer(self)
+        self._toggle_timer.setSingleShot(True)
+        self._toggle_timer.timeout.connect(self._handle_single_click)
 
         self._update_appearance()
         
@@ -85,32 +450,52 @@ class TTSToggle(QPushButton):
         return self._enabled
     
     def set_enabled(self, enabled: bool):
-        """Set TTS enabled state - USER CONTROL ONLY."""
-        if self._enabled != enabled:
-            self._enabled = enabled
-            self.setChecked(enabled)
-            self._update_appearance()
+        """Set TTS enabled state - USER CONTROL ONLY.
+
+        A call made from a toggled slot still updates the state but does not
+        emit again, so slots cannot cascade into each other.
+        """
+        if self._enabled == enabled:
+            return
+        self._enabled = enabled
+        self._update_appearance()
+        if self._emitting:
+            return
+        self._emitting = True
+        try:
             self.toggled.emit(enabled)
+        finally:
+            self._emitting = False
 
     def mousePressEvent(self, event):
-        """Handle mouse press for single/double click detection."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self._click_count += 1
-
-            if self._click_count == 1:
-                # Start timer for single click
-                self._click_timer.start(self._double_click_interval)
-            elif self._click_count == 2:
-                # Double click detected
-                self._click_timer.stop()
-                self._click_count = 0
-                self._handle_double_click()
+        """Handle mouse press - show the toggled state right away, apply it after the double-click interval."""
+        if event.button() == self.LEFT_BUTTON:
+            self._update_appearance(not self._enabled)
+            self._toggle_timer.start(QApplication.doubleClickInterval())
 
         super().mousePressEvent(event)
 
+    def mouseDoubleClickEvent(self, event):
+        """Handle double click - delivered by Qt in place of the second press.
+
+        The first press's pending toggle is dropped, so TTS and the session
+        are left as they were.
+        """
+        if event.button() == self.LEFT_BUTTON:
+            self._toggle_timer.stop()
+            self._update_appearance()
+            self._handle_double_click()
+            # Not forwarded: the base class would treat it as another press
+            event.accept()
+            return
+
+        super().mouseDoubleClickEvent(event)
+
+    def nextCheckState(self):
+        """Leave the checked state to _update_appearance instead of flipping it on click."""
+
     def _handle_single_click(self):
         """Handle single click - toggle TTS on/off."""
-        self._click_count = 0
         # Simple toggle: if enabled, disable it; if disabled, enable it
         new_state = not self._enabled
         self.set_enabled(new_state)
@@ -119,38 +504,19 @@ class TTSToggle(QPushButton):
         """Handle double click - stop TTS and open chat."""
         self.double_clicked.emit()
 
-    def _update_appearance(self):
-        """Update button appearance based on user's toggle state ONLY."""
+    def _update_appearance(self, enabled=None):
+        """Update button appearance based on user's toggle state ONLY.
+
+        Args:
+            enabled: State to show; defaults to the applied state
+        """
+        if enabled is None:
+            enabled = self._enabled
         # SIMPLE USER CONTROL - only shows enabled/disabled state
-        if self._enabled:
-            # User has enabled TTS
-            icon = "🔉"  # Speaker icon when enabled
-            bg_color = "rgba(0, 102, 204, 0.8)"  # Blue
-            text_color = "#ffffff"
-        else:
-            # User has disabled TTS
-            icon = "🔇"  # Muted speaker when disabled
-            bg_color = "rgba(255, 255, 255, 0.06)"
-            text_color = "rgba(255, 255, 255, 0.7)"
-
-        self.setText(icon)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background: {bg_color};
-                border: none;
-                border-radius: 12px;
-                font-size: 12px;
-                color: {text_color};
-                font-family: -apple-system, system-ui, sans-serif;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background: rgba(0, 122, 255, 0.8);
-            }}
-            QPushButton:pressed {{
-                background: rgba(0, 122, 255, 0.6);
-            }}
-        """)
+        # Speaker icon when enabled (blue), muted speaker when disabled
+        self.setChecked(enabled)
+        self.setText("🔉" if enabled else "🔇")
+        self.setStyleSheet(self.STYLESHEETS[enabled])
 
 
 class FullVoiceToggle(QPushButton):
@@ -158,11 +524,20 @@ class FullVoiceToggle(QPushButton):
 
     toggled = pyqtSignal(bool)
 
+    # Stylesheet per enabled state, built once at import
+    STYLESHEETS = {
+        True: _toggle_stylesheet("rgba(0, 122, 204, 0.8)", "#ffffff",
+                                 "rgba(0, 122, 204, 1.0)", "rgba(0, 122, 204, 0.6)"),
+        False: _toggle_stylesheet("rgba(255, 255, 255, 0.06)", "rgba(255, 255, 255, 0.7)",
+                                  "rgba(255, 255, 255, 0.06)", "rgba(255, 255, 255, 0.06)"),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(40, 24)  # Slightly wider for button
         self.setToolTip("Full Voice Mode: Continuous listening with speech-to-text and text-to-speech")
         self._enabled = False
+        self._emitting = False
         self.setCheckable(True)
         self.clicked.connect(self._on_clicked)
         self._update_appearance()
@@ -174,87 +549,217 @@ class FullVoiceToggle(QPushButton):
     def _on_clicked(self):
         """Handle button click."""
         self._enabled = self.isChecked()
-        self.toggled.emit(self._enabled)
         self._update_appearance()
+        self._emit_toggled(self._enabled)
 
     def set_enabled(self, enabled: bool):
-        """Set Full Voice Mode enabled state."""
-        if self._enabled != enabled:
-            self._enabled = enabled
-            self.setChecked(enabled)
-            self._update_appearance()
-            self.toggled.emit(enabled)
+        """Set Full Voice Mode enabled state.
 
+        A call made from a toggled slot (e.g. resetting the toggle when Full
+        Voice Mode fails to start) updates the state without emitting again.
+        """
+        if self._enabled == enabled:
+            return
+        self._enabled = enabled
+        self.setChecked(enabled)
+        self._update_appearance()
+        self._emit_toggled(enabled)
+
+    def _emit_toggled(self, enabled: bool):
+        """Emit toggled unless already inside a toggled emission."""
+        if self._emitting:
+            return
+        self._emitting = True
+        try:
+            self.toggled.emit(enabled)
+        finally:
+            self._emitting = False
 
     def _update_appearance(self):
         """Update button appearance based on user's toggle state ONLY."""
         # SIMPLE USER CONTROL - only shows enabled/disabled state
-        if self._enabled:
-            # User has enabled Full Voice Mode
-            icon = "🎙️"  # Microphone when enabled
-            bg_color = "rgba(0, 122, 204, 0.8)"  # Blue
-            text_color = "#ffffff"
-        else:
-            # User has disabled Full Voice Mode
-            icon = "🎤"  # Muted microphone when disabled
-            bg_color = "rgba(255, 255, 255, 0.06)"
-            text_color = "rgba(255, 255, 255, 0.7)"
-
-        self.setText(icon)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background: {bg_color};
-                border: none;
-                border-radius: 12px;
-                font-size: 12px;
-                color: {text_color};
-                font-family: -apple-system, system-ui, sans-serif;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background: {bg_color.replace('0.8', '1.0') if '0.8' in bg_color else bg_color};
-            }}
-            QPushButton:pressed {{
-                background: {bg_color.replace('0.8', '0.6') if '0.8' in bg_color else bg_color};
-            }}
-        """)
+        # Microphone when enabled (blue), muted microphone when disabled
+        self.setText("🎙️" if self._enabled else "🎤")
+        self.setStyleSheet(self.STYLESHEETS[self._enabled])
 
 
 
 
 class LLMWorker(QThread):
-    """Worker thread for LLM processing."""
+    """Persistent worker thread for LLM processing.
+
+    Messages are queued with submit() and processed one at a time, so a single
+    thread serves every request for the lifetime of the bubble.
+    """
     
     response_ready = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, llm_manager, message, provider, model):
+    def __init__(self, llm_manager, debug=False):
         super().__init__()
         self.llm_manager = llm_manager
-        self.message = message
-        self.provider = provider
-        self.model = model
+        self.debug = debug
+        self._requests = queue.Queue()
     
-    def run(self):
-        """Run LLM processing in background."""
+    def submit(self, message, provider, model):
+        """Queue a message for processing, restarting the thread if it was stopped."""
+        if self.isRunning():
+            self._requests.put((message, provider, model))
+            return
+
+        # A thread stopped mid-request exits without reading the None sentinel
+        # stop() queued; drop it so the restarted thread does not exit at once
+        self.cancel_pending()
+        self._requests.put((message, provider, model))
+        self.start()
+    
+    def cancel_pending(self):
+        """Drop queued requests that have not started processing yet."""
         try:
-            # Use LLMManager session for context persistence
-            response = self.llm_manager.generate_response(self.message, self.provider, self.model)
-            
-            # Response is already a string from LLMManager
-            response_text = str(response)
-            
-            self.response_ready.emit(response_text)
+            while True:
+                self._requests.get_nowait()
+        except queue.Empty:
+            pass
+    
+    def stop(self):
+        """Ask the thread to exit once the current request has finished."""
+        self.requestInterruption()
+        self.cancel_pending()
+        self._requests.put(None)
+    
+    def run(self):
+        """Process queued LLM requests in background."""
+        while True:
+            # Blocking get: the idle thread sleeps on the queue lock (GIL released)
+            request = self._requests.get()
+            if request is None:
+                break
             
+            message, provider, model = request
+            try:
+                # Use LLMManager session for context persistence
+                response = self.llm_manager.generate_response(message, provider, model)
+                if self.isInterruptionRequested():
+                    # Stopped while generating; nobody is waiting for this reply
+                    break
+                
+                # LLMManager returns a str; only convert anything else
+                response_text = response if isinstance(response, str) else str(response)
+                
+                self.response_ready.emit(response_text)
+                
+            except Exception as e:
+                if self.debug:
+                    print(f"❌ LLM Error: {e}")
+                    import traceback
+                    traceback.print_exc()
+                self.error_occurred.emit(str(e))
+
+
+class DiscoveryWorker(QThread):
+    """Worker thread for provider and model discovery.
+
+    Discovery can hit the network or the disk, so it runs here instead of
+    blocking the UI thread while the bubble is being built.
+    """
+
+    discovered = pyqtSignal(list, str, list)  # providers, selected provider, its models
+
+    def __init__(self, provider_manager, preferred_provider='lmstudio'):
+        super().__init__()
+        self.provider_manager = provider_manager
+        self.preferred_provider = preferred_provider
+
+    def run(self):
+        """Discover providers, pick one, and list its models.
+
+        Always emits discovered, with the LMStudio fallback if discovery
+        fails. Model lists of the other server-backed providers are then
+        prefetched into the cache, so switching provider later does not block.
+        """
+        try:
+            providers = self.provider_manager.get_available_providers(exclude_mock=True)
+
+            preferred = self.provider_manager.get_preferred_provider(providers, self.preferred_provider)
+            if preferred:
+                provider = preferred[1]
+            elif providers:
+                provider = providers[0][1]
+            else:
+                provider = self.preferred_provider
+
+            models = self.provider_manager.get_models_for_provider(provider)
+        except Exception as e:
+            if self.provider_manager.debug:
+                print(f"❌ Provider discovery failed: {e}")
+            providers = [("LMStudio (Local)", "lmstudio")]
+            provider = "lmstudio"
+            models = list(self.provider_manager.FALLBACK_MODELS.get(provider, []))
+
+        self.discovered.emit(providers, provider, models)
+
+        # A daemon thread, so a hung lookup can never hold up application exit
+        others = [key for _, key in providers if key != provider]
+        if others:
+            threading.Thread(target=self.provider_manager.prefetch_models, args=(others,), daemon=True).start()
+
+
+class VoiceInitWorker(QThread):
+    """Worker thread that builds the VoiceManager.
+
+    AbstractVoice loads its speech models when constructed, so this runs off
+    the UI thread and the bubble adds its voice controls once it is ready.
+    """
+
+    ready = pyqtSignal(object)  # the VoiceManager, or None if it failed
+
+    def __init__(self, debug=False):
+        super().__init__()
+        self.debug = debug
+
+    def run(self):
+        """Build the VoiceManager and always emit ready."""
+        voice_manager = None
+        try:
+            voice_manager = VoiceManager(debug_mode=self.debug)
+            if self.debug:
+                print("🔊 VoiceManager initialized")
         except Exception as e:
-            print(f"❌ LLM Error: {e}")
-            import traceback
-            traceback.print_exc()
-            self.error_occurred.emit(str(e))
+            if self.debug:
+                print(f"❌ Failed to initialize VoiceManager: {e}")
+
+        self.ready.emit(voice_manager)
 
 
 class QtChatBubble(QWidget):
     """Modern Qt-based chat bubble."""
+
+    # Transcriptions arrive on the speech-to-text thread; handled on the UI thread
+    voice_input_received = pyqtSignal(str)
+
+    # Status text -> "state" property matched by the status pill QSS selectors
+    STATUS_STATES = {
+        'ready': 'ready',
+        'idle': 'ready',
+        'listening': 'listening',
+        'processing': 'generating',
+        'generating': 'generating',
+        'error': 'error',
+    }
+
+    # Keys and modifiers that send the message from the input field (plain
+    # Enter inserts a newline), resolved once for eventFilter
+    SEND_KEYS = (Qt.Key.Key_Return, Qt.Key.Key_Enter)
+    SEND_MODIFIERS = (
+        Qt.KeyboardModifier.ShiftModifier |
+        Qt.KeyboardModifier.ControlModifier |
+        Qt.KeyboardModifier.MetaModifier
+    )
+
+    # Bubble size; the width is fixed once, only the height follows the input UI
+    BUBBLE_WIDTH = 630
+    TEXT_MODE_HEIGHT = 196
+    VOICE_MODE_HEIGHT = 120
     
     def __init__(self, llm_manager, config=None, debug=False, listening_mode="wait"):
         super().__init__()
@@ -267,53 +772,94 @@ class QtChatBubble(QWidget):
         self.current_provider = 'lmstudio'  # Default to LMStudio
         self.current_model = 'qwen/qwen3-next-80b'  # Default to qwen/qwen3-next-80b
         self.token_count = 0
-        self.max_tokens = 128000
+        self.max_tokens = DEFAULT_MAX_TOKENS
+        self._max_display = self._format_tokens(self.max_tokens)
+        self._last_token_text = ""
+        self._last_status_text = "READY"
         
-        # Message history for session management
+        # Message history for session management, mirrored from the AbstractCore
+        # session: which session it mirrors and how many of its messages are in
         self.message_history: List[Dict] = []
+        self._history_session = None
+        self._history_synced = 0
 
         # History dialog instance for toggle behavior
         self.history_dialog = None
         
-        # Initialize new manager classes
+        # Initialize new manager classes (imported unconditionally above, so
+        # only their construction can fail)
         self.provider_manager = None
         self.tts_state_manager = None
-        if MANAGERS_AVAILABLE:
-            try:
-                self.provider_manager = ProviderManager(debug=debug)
-                self.tts_state_manager = TTSStateManager(debug=debug)
-                if self.debug:
-                    print("✅ Manager classes initialized")
-            except Exception as e:
-                if self.debug:
-                    print(f"❌ Failed to initialize manager classes: {e}")
+        try:
+            self.provider_manager = ProviderManager(debug=debug)
+            self.tts_state_manager = TTSStateManager(debug=debug)
+            if self.debug:
+                print("✅ Manager classes initialized")
+        except Exception as e:
+            if self.debug:
+                print(f"❌ Failed to initialize manager classes: {e}")
 
-        # TTS functionality (AbstractVoice-compatible)
+        # TTS functionality (AbstractVoice-compatible). The VoiceManager is
+        # built by load_voice_manager() on a VoiceInitWorker; until it is
+        # ready voice_manager stays None and no voice controls are shown
         self.voice_manager = None
         self.tts_enabled = False
-        if TTS_AVAILABLE:
-            try:
-                self.voice_manager = VoiceManager(debug_mode=debug)
-                # Connect voice manager to TTS state manager
-                if self.tts_state_manager:
-                    self.tts_state_manager.set_voice_manager(self.voice_manager)
-                if self.debug:
-                    print("🔊 VoiceManager initialized")
-            except Exception as e:
-                if self.debug:
-                    print(f"❌ Failed to initialize VoiceManager: {e}")
+        self._voice_init_worker = None
         
         # Callbacks
         self.response_callback = None
         self.error_callback = None
         self.status_callback = None  # New callback for status updates
+        self.app_quit_callback = None
+
+        # Optional widgets, created by setup_ui() only when voice is available
+        self.history_button = None
+        self.tts_toggle = None
+        self.full_voice_toggle = None
+        self.voice_control_panel = None
+        
+        # Persistent worker thread, started up front (during preflight) so
+        # sending a message never has to create a thread
+        self.worker = LLMWorker(self.llm_manager, debug=debug)
+        # Worker signals are emitted from its thread; always deliver on the UI thread
+        self.worker.response_ready.connect(self.on_response_ready, Qt.ConnectionType.QueuedConnection)
+        self.worker.error_occurred.connect(self.on_error_occurred, Qt.ConnectionType.QueuedConnection)
+        self.voice_input_received.connect(self._submit_voice_input, Qt.ConnectionType.QueuedConnection)
+        self.worker.start()
         
-        # Worker thread
-        self.worker = None
+        # Set while a Full Voice Mode turn waits for its reply; transcriptions
+        # arriving meanwhile are ignored, as when the reply was generated inline
+        self._voice_turn_pending = False
+        
+        # Background provider discovery, created by load_providers()
+        self._discovery_worker = None
+        
+        # Primary screen and its geometry, cached by _get_screen_geometry()
+        self._screen = None
+        self._screen_geometry = None
+        
+        # Coalesces bursts of token counter updates into one label refresh
+        self._token_display_timer = QTimer(self)
+        self._token_display_timer.setSingleShot(True)
+        self._token_display_timer.setInterval(100)
+        self._token_display_timer.timeout.connect(self._flush_token_display)
+
+        # Watches the voice manager on the UI thread until a response finishes speaking
+        self._tts_poll_timer = QTimer(self)
+        self._tts_poll_timer.setInterval(100)
+        self._tts_poll_timer.timeout.connect(self._poll_tts_state)
+
+        # Back-to-back worker errors are reported once, with the latest error
+        self._pending_error = None
+        self._error_timer = QTimer(self)
+        self._error_timer.setSingleShot(True)
+        self._error_timer.setInterval(10)
+        self._error_timer.timeout.connect(self._flush_error)
         
         self.setup_ui()
         self.setup_styling()
         self.load_providers()
+        self.load_voice_manager()
         
         if self.debug:
             print("✅ QtChatBubble initialized")
@@ -328,7 +874,7 @@ class QtChatBubble(QWidget):
         )
         
         # Set optimal size for modern chat interface - much wider to nearly touch screen edge
-        self.setFixedSize(630, 196)  # Increased width from 540 to 700 for better text display
+        self.setFixedSize(self.BUBBLE_WIDTH, self.TEXT_MODE_HEIGHT)
         self.position_near_tray()
         
         # Main layout with minimal spacing
@@ -345,21 +891,7 @@ class QtChatBubble(QWidget):
         self.close_button = QPushButton("⨯")  # Better close icon - geometric multiplication symbol
         self.close_button.setFixedSize(24, 24)  # Increased from 18x18 to 24x24 for better visibility
         self.close_button.clicked.connect(self.close_app)
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.15);
-                border: none;
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: 600;
-                color: rgba(255, 255, 255, 0.9);
-                font-family: -apple-system, system-ui, sans-serif;
-            }
-            QPushButton:hover {
-                background: rgba(255, 60, 60, 0.8);
-                color: #ffffff;
-            }
-        """)
+        self.close_button.setObjectName("close_button")
         header_layout.addWidget(self.close_button)
         
         # Session buttons (minimal, rounded)
@@ -374,76 +906,34 @@ class QtChatBubble(QWidget):
             btn = QPushButton(text)
             btn.setFixedHeight(22)
             btn.clicked.connect(handler)
+            btn.setObjectName("session_button")
 
             # Store reference to history button for toggle appearance
             if text == "History":
                 self.history_button = btn
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: rgba(255, 255, 255, 0.06);
-                    border: none;
-                    border-radius: 11px;
-                    font-size: 10px;
-                    color: rgba(255, 255, 255, 0.7);
-                    font-family: -apple-system, system-ui, sans-serif;
-                    padding: 0 10px;
-                }
-                QPushButton:hover {
-                    background: rgba(255, 255, 255, 0.12);
-                    color: rgba(255, 255, 255, 0.9);
-                }
-            """)
+                btn.setProperty("active", False)
             header_layout.addWidget(btn)
         
-        # TTS toggle (if available)
-        if self.voice_manager and self.voice_manager.is_available():
-            self.tts_toggle = TTSToggle()
-            self.tts_toggle.toggled.connect(self.on_tts_toggled)
-            self.tts_toggle.single_clicked.connect(self.on_tts_single_click)
-            self.tts_toggle.double_clicked.connect(self.on_tts_double_click)
-            header_layout.addWidget(self.tts_toggle)
-
-            # Full Voice Mode toggle (STT + TTS)
-            self.full_voice_toggle = FullVoiceToggle()
-            self.full_voice_toggle.toggled.connect(self.on_full_voice_toggled)
-            header_layout.addWidget(self.full_voice_toggle)
-
-            # Add prominent voice control panel when TTS is active
-            self.voice_control_panel = self.create_voice_control_panel()
-            header_layout.addWidget(self.voice_control_panel)
-            self.voice_control_panel.hide()  # Hidden initially
+        # Voice controls go after the session buttons; _add_voice_controls
+        # inserts them once the VoiceManager is ready
+        self._header_layout = header_layout
         
         header_layout.addStretch()
         
         # Status (Cursor-style, enlarged to show full text including "Processing")
+        # Styled by the QLabel#status_label[state=...] rules in setup_styling
         self.status_label = QLabel("READY")
+        self.status_label.setObjectName("status_label")
+        self.status_label.setProperty("state", "ready")
         self.status_label.setFixedSize(120, 24)  # Increased from 80x24 to 120x24 for "Processing" text
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                background: #22c55e;
-                border: none;
-                border-radius: 12px;
-                font-size: 10px;
-                font-weight: 600;
-                color: #ffffff;
-                font-family: -apple-system, system-ui, sans-serif;
-            }
-        """)
         header_layout.addWidget(self.status_label)
         
         layout.addLayout(header_layout)
         
         # Input section with modern card design
         self.input_container = QFrame()
-        self.input_container.setStyleSheet("""
-            QFrame {
-                background: #1e1e1e;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 4px;
-            }
-        """)
+        self.input_container.setObjectName("input_container")
         input_layout = QVBoxLayout(self.input_container)
         input_layout.setContentsMargins(4, 4, 4, 4)
         input_layout.setSpacing(4)
@@ -463,33 +953,7 @@ class QtChatBubble(QWidget):
         self.send_button = QPushButton("→")
         self.send_button.clicked.connect(self.send_message)
         self.send_button.setFixedSize(40, 40)
-        self.send_button.setStyleSheet("""
-            QPushButton {
-                background: #0066cc;
-                border: 1px solid #0080ff;
-                border-radius: 20px;
-                font-size: 16px;
-                font-weight: bold;
-                color: white;
-                text-align: center;
-                padding: 0px;
-            }
-            
-            QPushButton:hover {
-                background: #0080ff;
-                border: 1px solid #0099ff;
-            }
-            
-            QPushButton:pressed {
-                background: #0052a3;
-            }
-            
-            QPushButton:disabled {
-                background: #404040;
-                color: #666666;
-                border: 1px solid #333333;
-            }
-        """)
+        self.send_button.setObjectName("send_button")
         input_row.addWidget(self.send_button)
         
         input_layout.addLayout(input_row)
@@ -502,62 +966,18 @@ class QtChatBubble(QWidget):
         
         # Provider dropdown (rounded, clean)
         self.provider_combo = QComboBox()
-        self.provider_combo.currentTextChanged.connect(self.on_provider_changed)
+        self.provider_combo.currentIndexChanged.connect(self.on_provider_changed)
         self.provider_combo.setFixedHeight(28)
         self.provider_combo.setMinimumWidth(100)
-        self.provider_combo.setStyleSheet("""
-            QComboBox {
-                background: rgba(255, 255, 255, 0.08);
-                border: none;
-                border-radius: 14px;
-                padding: 0 12px;
-                font-size: 11px;
-                color: rgba(255, 255, 255, 0.9);
-                font-family: -apple-system, system-ui, sans-serif;
-            }
-            QComboBox:hover {
-                background: rgba(255, 255, 255, 0.12);
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-                width: 0px;
-            }
-        """)
+        self.provider_combo.setObjectName("provider_combo")
         controls_layout.addWidget(self.provider_combo)
         
         # Model dropdown (rounded, clean)
         self.model_combo = QComboBox()
-        self.model_combo.currentTextChanged.connect(self.on_model_changed)
+        self.model_combo.currentIndexChanged.connect(self.on_model_changed)
         self.model_combo.setFixedHeight(28)
         self.model_combo.setMinimumWidth(140)
-        self.model_combo.setStyleSheet("""
-            QComboBox {
-                background: rgba(255, 255, 255, 0.08);
-                border: none;
-                border-radius: 14px;
-                padding: 0 12px;
-                font-size: 11px;
-                color: rgba(255, 255, 255, 0.9);
-                font-family: -apple-system, system-ui, sans-serif;
-            }
-            QComboBox:hover {
-                background: rgba(255, 255, 255, 0.12);
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-                width: 0px;
-            }
-        """)
+        self.model_combo.setObjectName("model_combo")
         controls_layout.addWidget(self.model_combo)
         
         controls_layout.addStretch()
@@ -567,16 +987,7 @@ class QtChatBubble(QWidget):
         self.token_label.setFixedHeight(36)  # Increased by 30% (28 * 1.3 = 36.4 ≈ 36)
         self.token_label.setMinimumWidth(104)  # Increased by 30% (80 * 1.3 = 104)
         self.token_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.token_label.setStyleSheet("""
-            QLabel {
-                background: rgba(255, 255, 255, 0.06);
-                border: none;
-                border-radius: 14px;
-                font-size: 12px;
-                color: rgba(255, 255, 255, 0.6);
-                font-family: -apple-system, system-ui, sans-serif;
-            }
-        """)
+        self.token_label.setObjectName("token_label")
         controls_layout.addWidget(self.token_label)
         
         # Add a simple chat display area between header and input
@@ -592,217 +1003,53 @@ class QtChatBubble(QWidget):
         # Focus on input
         self.input_text.setFocus()
 
-        # Enter key handling
-        self.input_text.keyPressEvent = self.handle_key_press
+        # Enter key handling; QTextEdit claims (Shift+)Return before any
+        # QShortcut sees it, so the key press is intercepted instead
+        self.input_text.installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        """Send the message on Shift/Ctrl/Cmd+Enter in the input field."""
+        if (obj is self.input_text and event.type() == QEvent.Type.KeyPress and
+                event.key() in self.SEND_KEYS and event.modifiers() & self.SEND_MODIFIERS):
+            self.send_message()
+            return True
+
+        return super().eventFilter(obj, event)
     
     def setup_styling(self):
         """Set up Cursor-style clean theme."""
-        self.setStyleSheet("""
-            /* Main Window - Cursor Style */
-            QWidget {
-                background: #1e1e1e;
-                border: none;
-                border-radius: 12px;
-                color: #ffffff;
-            }
-            
-            /* Input Field - Modern Grey Design */
-            QTextEdit {
-                background: #1e1e1e;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 12px 16px;
-                font-size: 14px;
-                font-weight: 400;
-                color: #ffffff;
-                font-family: system-ui, -apple-system, sans-serif;
-                selection-background-color: #0066cc;
-                line-height: 1.4;
-            }
-            
-            QTextEdit:focus {
-                border: 1px solid #0066cc;
-                background: #252525;
-            }
-            
-            QTextEdit::placeholder {
-                color: rgba(255, 255, 255, 0.6);
-            }
-            
-            /* Buttons - Grey Theme */
-            QPushButton {
-                background: #404040;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-                font-weight: 500;
-                color: #ffffff;
-                font-family: system-ui, -apple-system, sans-serif;
-            }
-            
-            QPushButton:hover {
-                background: #505050;
-                border: 1px solid #0066cc;
-            }
-            
-            QPushButton:pressed {
-                background: #353535;
-            }
-            
-            QPushButton:disabled {
-                background: #2a2a2a;
-                color: #666666;
-                border: 1px solid #333333;
-            }
-            
-            /* Dropdown Menus - Grey Theme */
-                QComboBox {
-                    background: #1e1e1e;
-                    border: 1px solid #404040;
-                    border-radius: 6px;
-                    padding: 6px 10px;
-                    min-width: 80px;
-                    font-size: 12px;
-                    font-weight: 400;
-                    color: #ffffff;
-                    font-family: system-ui, -apple-system, sans-serif;
-                    letter-spacing: 0.01em;
-                }
-            
-            QComboBox:hover {
-                border: 1px solid #0066cc;
-                background: #252525;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid rgba(255, 255, 255, 0.7);
-                width: 0px;
-                height: 0px;
-            }
-            
-                QComboBox QAbstractItemView {
-                    background: #1a202c;
-                    border: 1px solid #4a5568;
-                    border-radius: 8px;
-                    selection-background-color: #4299e1;
-                    color: #e2e8f0;
-                    padding: 4px;
-                    font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display", "Segoe UI", Roboto, sans-serif;
-                }
-                
-                QComboBox QAbstractItemView::item {
-                    height: 36px;
-                    padding: 8px 12px;
-                    border: none;
-                    font-size: 12px;
-                    font-weight: 400;  /* Changed from 500 to 400 (normal weight) */
-                    color: #e2e8f0;
-                    border-radius: 4px;
-                    margin: 2px;
-                }
-                
-                QComboBox QAbstractItemView::item:selected {
-                    background: #4299e1;
-                    color: #ffffff;
-                }
-                
-                QComboBox QAbstractItemView::item:hover {
-                    background: #374151;
-                }
-            
-            QComboBox QAbstractItemView::item:selected {
-                background: #4299e1;
-            }
-            
-            /* Labels - Clean Typography */
-            QLabel {
-                color: rgba(255, 255, 255, 0.8);
-                font-size: 12px;
-                font-weight: 500;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                letter-spacing: 0.3px;
-            }
-            
-            /* Status and Token Labels - Accent Colors */
-            QLabel#status_ready {
-                background: rgba(166, 227, 161, 0.15);
-                border: 1px solid rgba(166, 227, 161, 0.3);
-                border-radius: 12px;
-                padding: 6px 12px;
-                font-size: 10px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                color: #a6e3a1;
-                font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display", "Segoe UI", Roboto, sans-serif;
-            }
-            
-            QLabel#status_generating {
-                background: rgba(250, 179, 135, 0.15);
-                border: 1px solid rgba(250, 179, 135, 0.3);
-                border-radius: 12px;
-                padding: 6px 12px;
-                font-size: 10px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                color: #fab387;
-                font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display", "Segoe UI", Roboto, sans-serif;
-            }
-            
-            QLabel#status_error {
-                background: rgba(243, 139, 168, 0.15);
-                border: 1px solid rgba(243, 139, 168, 0.3);
-                border-radius: 12px;
-                padding: 6px 12px;
-                font-size: 10px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                color: #f38ba8;
-                font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display", "Segoe UI", Roboto, sans-serif;
-            }
-            
-            QLabel#token_label {
-                background: #2d3748;
-                border: 1px solid #4a5568;
-                border-radius: 8px;
-                padding: 10px 12px;
-                font-family: -apple-system, BlinkMacSystemFont, "SF Pro Display", "Segoe UI", Roboto, sans-serif;
-                font-size: 11px;
-                font-weight: 500;
-                color: #cbd5e0;
-                text-align: center;
-                letter-spacing: 0.025em;
-            }
-            
-            /* Frames - Invisible Containers */
-            QFrame {
-                border: none;
-                background: transparent;
-            }
-            
-            /* Separator Lines */
-            QLabel#separator {
-                color: rgba(255, 255, 255, 0.3);
-                font-size: 14px;
-                font-weight: 300;
-            }
-        """)
+        self.setStyleSheet(BUBBLE_STYLESHEET)
+    
+    def _get_screen_geometry(self):
+        """Return the primary screen geometry, querying the window system only once."""
+        if self._screen_geometry is None:
+            if self._screen is None:
+                # Follow the primary screen if the user switches displays
+                QApplication.instance().primaryScreenChanged.connect(self._on_primary_screen_changed)
+            self._screen = QApplication.primaryScreen()
+            self._screen_geometry = self._screen.geometry()
+            # Keep the cache (and our position) in sync with resolution changes
+            self._screen.geometryChanged.connect(self._on_screen_geometry_changed)
+        return self._screen_geometry
+    
+    def _on_screen_geometry_changed(self, geometry):
+        """Refresh the cached screen geometry and re-anchor the bubble."""
+        self._screen_geometry = geometry
+        self.position_near_tray()
+    
+    def _on_primary_screen_changed(self, screen):
+        """Drop the cached geometry of the old primary screen and re-anchor the bubble."""
+        try:
+            self._screen.geometryChanged.disconnect(self._on_screen_geometry_changed)
+        except (TypeError, RuntimeError):
+            pass  # Old screen already removed
+        self._screen_geometry = None
+        self.position_near_tray()
     
     def position_near_tray(self):
         """Position the bubble near the system tray."""
         # Get screen geometry
-        screen = QApplication.primaryScreen().geometry()
+        screen = self._get_screen_geometry()
         
         # Position at the right corner with no gap
         x = screen.width() - self.width()  # 0px from right edge - touching the corner
@@ -813,64 +1060,122 @@ class QtChatBubble(QWidget):
         if self.debug:
             print(f"Positioned bubble at ({x}, {y})")
     
-    def load_providers(self):
-        """Load available providers using ProviderManager."""
+    def _populate_combo(self, combo, items, current_key=None):
+        """Replace a combo's items without emitting change signals.
+
+        Args:
+            combo: QComboBox to fill
+            items: List of (display_name, key) tuples
+            current_key: Key of the item to select, if any
+        """
+        current_index = None
+        combo.blockSignals(True)
         try:
-            # Clear and populate provider combo
-            self.provider_combo.clear()
+            combo.clear()
+            combo.addItems([display_name for display_name, _ in items])
+            for index, (_, key) in enumerate(items):
+                combo.setItemData(index, key)
+                # Note the selection while filling instead of a findData() scan
+                if current_index is None and current_key is not None and key == current_key:
+                    current_index = index
+
+            if current_index is not None:
+                combo.setCurrentIndex(current_index)
+        finally:
+            combo.blockSignals(False)
+    
+    def load_voice_manager(self):
+        """Build the VoiceManager on a VoiceInitWorker.
 
-            if self.provider_manager:
-                # Use new ProviderManager
-                available_providers = self.provider_manager.get_available_providers(exclude_mock=True)
+        _on_voice_manager_ready attaches it and adds the voice controls.
+        """
+        if self.voice_manager or (self._voice_init_worker and self._voice_init_worker.isRunning()):
+            return
 
-                if self.debug:
-                    print(f"🔍 ProviderManager found {len(available_providers)} available providers")
+        self._voice_init_worker = VoiceInitWorker(debug=self.debug)
+        self._voice_init_worker.ready.connect(
+            self._on_voice_manager_ready, Qt.ConnectionType.QueuedConnection
+        )
+        self._voice_init_worker.start()
 
-                # Add providers to dropdown
-                for display_name, provider_key in available_providers:
-                    self.provider_combo.addItem(display_name, provider_key)
-                    if self.debug:
-                        print(f"    ✅ Added: {display_name} ({provider_key})")
-
-                # Set preferred provider
-                preferred = self.provider_manager.get_preferred_provider(available_providers, 'lmstudio')
-                if preferred:
-                    display_name, provider_key = preferred
-                    # Find and set the preferred provider
-                    for i in range(self.provider_combo.count()):
-                        if self.provider_combo.itemData(i) == provider_key:
-                            self.provider_combo.setCurrentIndex(i)
-                            self.current_provider = provider_key
-                            break
-                elif self.provider_combo.count() > 0:
-                    # Use first available
-                    self.current_provider = self.provider_combo.itemData(0)
-                    self.provider_combo.setCurrentIndex(0)
+    @pyqtSlot(object)
+    def _on_voice_manager_ready(self, voice_manager):
+        """Attach the VoiceManager built by VoiceInitWorker and show the voice controls."""
+        if voice_manager is None:
+            return
 
-            else:
-                # Fallback: use old discovery method
-                from abstractcore.providers import list_available_providers
-                available_providers = list_available_providers()
-
-                provider_display_names = {
-                    'openai': 'OpenAI', 'anthropic': 'Anthropic', 'ollama': 'Ollama',
-                    'lmstudio': 'LMStudio', 'mlx': 'MLX', 'huggingface': 'HuggingFace'
-                }
-
-                for provider_name in available_providers:
-                    if provider_name != 'mock':  # Exclude mock
-                        display_name = provider_display_names.get(provider_name, provider_name.title())
-                        self.provider_combo.addItem(display_name, provider_name)
-
-                self.current_provider = 'lmstudio' if 'lmstudio' in available_providers else (
-                    available_providers[0] if available_providers else 'lmstudio'
-                )
+        self.voice_manager = voice_manager
+        # Connect voice manager to TTS state manager
+        if self.tts_state_manager:
+            self.tts_state_manager.set_voice_manager(self.voice_manager)
 
-            if self.debug:
-                print(f"🔍 Final selected provider: {self.current_provider}")
+        if self.voice_manager.is_available():
+            self._add_voice_controls()
+
+    def _add_voice_controls(self):
+        """Add the TTS and Full Voice Mode toggles and the voice control panel to the header."""
+        index = self._header_layout.indexOf(self.history_button) + 1
+
+        # TTS toggle
+        self.tts_toggle = TTSToggle()
+        self.tts_toggle.toggled.connect(self.on_tts_toggled)
+        self.tts_toggle.single_clicked.connect(self.on_tts_single_click)
+        self.tts_toggle.double_clicked.connect(self.on_tts_double_click)
+        self._header_layout.insertWidget(index, self.tts_toggle)
 
-            # Load models for current provider
-            self.update_models()
+        # Full Voice Mode toggle (STT + TTS)
+        self.full_voice_toggle = FullVoiceToggle()
+        self.full_voice_toggle.toggled.connect(self.on_full_voice_toggled)
+        self._header_layout.insertWidget(index + 1, self.full_voice_toggle)
+
+        # Add prominent voice control panel when TTS is active
+        self.voice_control_panel = self.create_voice_control_panel()
+        self._header_layout.insertWidget(index + 2, self.voice_control_panel)
+        self.voice_control_panel.hide()  # Hidden initially
+
+        if self.debug:
+            print("🔊 Voice controls added")
+
+    def load_providers(self):
+        """Load available providers using ProviderManager.
+
+        With a ProviderManager, discovery runs on a DiscoveryWorker and the
+        combos show a placeholder until _on_providers_discovered fills them.
+        """
+        if self.provider_manager:
+            if self._discovery_worker and self._discovery_worker.isRunning():
+                # A discovery is already in flight; its results will be used
+                return
+
+            self._populate_combo(self.provider_combo, [("Loading…", self.current_provider)], self.current_provider)
+            self._populate_combo(self.model_combo, [("Loading…", self.current_model)], self.current_model)
+
+            self._discovery_worker = DiscoveryWorker(self.provider_manager, 'lmstudio')
+            self._discovery_worker.discovered.connect(
+                self._on_providers_discovered, Qt.ConnectionType.QueuedConnection
+            )
+            self._discovery_worker.start()
+            return
+
+        try:
+            # Fallback: use old discovery method
+            from abstractcore.providers import list_available_providers
+            available_providers = list_available_providers()
+
+            provider_display_names = {
+                'openai': 'OpenAI', 'anthropic': 'Anthropic', 'ollama': 'Ollama',
+                'lmstudio': 'LMStudio', 'mlx': 'MLX', 'huggingface': 'HuggingFace'
+            }
+
+            items = [
+                (provider_display_names.get(provider_name, provider_name.title()), provider_name)
+                for provider_name in available_providers
+                if provider_name != 'mock'  # Exclude mock
+            ]
+
+            self.current_provider = 'lmstudio' if 'lmstudio' in available_providers else (
+                available_providers[0] if available_providers else 'lmstudio'
+            )
 
         except Exception as e:
             if self.debug:
@@ -879,67 +1184,76 @@ class QtChatBubble(QWidget):
                 traceback.print_exc()
 
             # Final fallback
-            if self.provider_combo.count() == 0:
-                self.provider_combo.addItem("LMStudio (Local)", "lmstudio")
-                self.current_provider = "lmstudio"
-                if self.debug:
-                    print("🔄 Using fallback provider list")
+            items = [("LMStudio (Local)", "lmstudio")]
+            self.current_provider = "lmstudio"
+            if self.debug:
+                print("🔄 Using fallback provider list")
+
+        # Fill the combo in one pass; no per-item provider change signals
+        self._populate_combo(self.provider_combo, items, self.current_provider)
+
+        if self.debug:
+            print(f"🔍 Final selected provider: {self.current_provider}")
+
+        # Load models for current provider
+        self.update_models()
     
-    def update_models(self):
-        """Update model dropdown using ProviderManager."""
-        try:
-            self.model_combo.clear()
+    def _on_providers_discovered(self, providers, provider, models):
+        """Fill the combos with the results of a DiscoveryWorker."""
+        if self.debug:
+            print(f"🔍 ProviderManager found {len(providers)} available providers")
+            for display_name, provider_key in providers:
+                print(f"    ✅ Added: {display_name} ({provider_key})")
+
+        self.current_provider = provider
+        self._populate_combo(self.provider_combo, providers, self.current_provider)
 
+        if self.debug:
+            print(f"🔍 Final selected provider: {self.current_provider}")
+
+        self.update_models(models)
+    
+    def update_models(self, models=None):
+        """Update model dropdown using ProviderManager.
+
+        Args:
+            models: Models already discovered for the current provider, if any
+        """
+        try:
             if self.provider_manager:
                 # Use ProviderManager with 3-tier fallback strategy
-                models = self.provider_manager.get_models_for_provider(self.current_provider)
+                if models is None:
+                    models = self.provider_manager.get_models_for_provider(self.current_provider)
 
                 if self.debug:
                     print(f"📋 ProviderManager loaded {len(models)} models for {self.current_provider}")
 
-                # Add models to dropdown with display names
-                for model in models:
-                    display_name = self.provider_manager.create_model_display_name(model, max_length=25)
-                    self.model_combo.addItem(display_name, model)
+                # Build (display_name, model) pairs
+                items = [
+                    (self.provider_manager.create_model_display_name(model, max_length=25), model)
+                    for model in models
+                ]
 
-                # Set preferred model
-                preferred_model = self.provider_manager.get_preferred_model(
+                # Set preferred model (falls back to current, then first available)
+                selected_model = self.provider_manager.get_preferred_model(
                     models,
                     preferred='qwen/qwen3-next-80b',
                     current=self.current_model
                 )
 
-                if preferred_model:
-                    # Find and set the preferred model
-                    for i in range(self.model_combo.count()):
-                        if self.model_combo.itemData(i) == preferred_model:
-                            self.model_combo.setCurrentIndex(i)
-                            self.current_model = preferred_model
-                            break
-                elif self.model_combo.count() > 0:
-                    # Use first available
-                    self.current_model = self.model_combo.itemData(0)
-                    self.model_combo.setCurrentIndex(0)
-
             else:
                 # Fallback: use old method
                 from abstractcore.providers import get_available_models_for_provider
                 models = get_available_models_for_provider(self.current_provider)
 
+                items = []
                 for model in models:
-                    display_name = model.split('/')[-1] if '/' in model else model
+                    display_name = model.rsplit('/', 1)[-1]
                     if len(display_name) > 25:
                         display_name = display_name[:22] + "..."
-                    self.model_combo.addItem(display_name, model)
-
-                if self.model_combo.count() > 0:
-                    self.current_model = self.model_combo.itemData(0)
-                    self.model_combo.setCurrentIndex(0)
+                    items.append((display_name, model))
 
-            if self.debug:
-                print(f"✅ Final selected model: {self.current_model}")
-
-            self.update_token_limits()
+                selected_model = models[0] if models else None
 
         except Exception as e:
             if self.debug:
@@ -948,70 +1262,77 @@ class QtChatBubble(QWidget):
                 traceback.print_exc()
 
             # Final fallback: add default model
-            if self.model_combo.count() == 0:
-                self.model_combo.addItem("Default Model", "default-model")
-                self.current_model = "default-model"
-                self.model_combo.setCurrentIndex(0)
-                if self.debug:
-                    print(f"🔄 Using final fallback model: {self.current_model}")
+            items = [("Default Model", "default-model")]
+            selected_model = "default-model"
+            if self.debug:
+                print(f"🔄 Using final fallback model: {selected_model}")
+
+        # Fill the combo in one pass; no per-item model change signals
+        self._populate_combo(self.model_combo, items, selected_model)
+        if selected_model:
+            self.current_model = selected_model
+
+        if self.debug:
+            print(f"✅ Final selected model: {self.current_model}")
+
+        self.update_token_limits()
     
     def update_token_limits(self):
         """Update token limits using AbstractCore's built-in detection."""
         # Get token limits from LLMManager (which uses AbstractCore's detection)
         if self.llm_manager and self.llm_manager.llm:
-            self.max_tokens = self.llm_manager.llm.max_tokens
+            max_tokens = self.llm_manager.llm.max_tokens
             
             if self.debug:
-                print(f"📊 Token limits from AbstractCore: {self.max_tokens}")
+                print(f"📊 Token limits from AbstractCore: {max_tokens}")
         else:
             # Fallback if LLM not initialized
-            self.max_tokens = 128000
-            
-        self.update_token_display()
+            max_tokens = DEFAULT_MAX_TOKENS
+        
+        # Model switches usually keep the same limit; skip the relabel then
+        if max_tokens != self.max_tokens:
+            self.max_tokens = max_tokens
+            self._max_display = self._format_tokens(max_tokens)
+            self.update_token_display()
     
     def update_token_display(self):
-        """Update token count display."""
-        max_display = f"{self.max_tokens // 1000}k" if self.max_tokens >= 1000 else str(self.max_tokens)
-        current_display = f"{int(self.token_count)}" if self.token_count < 1000 else f"{int(self.token_count // 1000)}k"
-        self.token_label.setText(f"{current_display} / {max_display}")
-    
-    def handle_key_press(self, event):
-        """Handle key press events in text input."""
-#        print(f"🔄 Key pressed: {event.key()}, modifiers: {event.modifiers()}")
-        
-        # Check for Enter/Return key
-        if event.key() == Qt.Key.Key_Return or event.key() == Qt.Key.Key_Enter:
-            # Shift+Enter or Ctrl+Enter or Cmd+Enter should send message
-            if (event.modifiers() & Qt.KeyboardModifier.ShiftModifier or 
-                event.modifiers() & Qt.KeyboardModifier.ControlModifier or 
-                event.modifiers() & Qt.KeyboardModifier.MetaModifier):
-                self.send_message()
-                return
-            # Plain Enter should add a new line (default behavior)
-        
-        # Call original keyPressEvent for all other keys
-        QTextEdit.keyPressEvent(self.input_text, event)
+        """Schedule a token count display refresh (coalesced to one per 100ms)."""
+        if not self._token_display_timer.isActive():
+            self._token_display_timer.start()
+    
+    def _flush_token_display(self):
+        """Write the current token count to the token label if it changed."""
+        text = f"{self._format_tokens(self.token_count)} / {self._max_display}"
+        if text != self._last_token_text:
+            self.token_label.setText(text)
+            self._last_token_text = text
+
+    @staticmethod
+    def _format_tokens(count) -> str:
+        """Format a token count for the token label (e.g. 950, 12k)."""
+        return f"{int(count // 1000)}k" if count >= 1000 else str(int(count))
     
-    def on_provider_changed(self, provider_name):
+    def on_provider_changed(self, index):
         """Handle provider change."""
-        # Find provider key by display name
-        for i in range(self.provider_combo.count()):
-            if self.provider_combo.itemText(i) == provider_name:
-                self.current_provider = self.provider_combo.itemData(i)
-                break
+        # Provider key is stored as item data
+        provider_key = self.provider_combo.itemData(index)
+        if provider_key is None or provider_key == self.current_provider:
+            # Empty combo or re-selection of the same provider: nothing to reload
+            return
+        self.current_provider = provider_key
         
         self.update_models()
         
         if self.debug:
             print(f"Provider changed to: {self.current_provider}")
     
-    def on_model_changed(self, model_name):
+    def on_model_changed(self, index):
         """Handle model change."""
-        # Find model key by display name
-        for i in range(self.model_combo.count()):
-            if self.model_combo.itemText(i) == model_name:
-                self.current_model = self.model_combo.itemData(i)
-                break
+        # Model key is stored as item data
+        model_key = self.model_combo.itemData(index)
+        if model_key is None or model_key == self.current_model:
+            return
+        self.current_model = model_key
         
         self.update_token_limits()
         
@@ -1037,62 +1358,36 @@ class QtChatBubble(QWidget):
         # 3. Update UI for sending state
         self.send_button.setEnabled(False)
         self.send_button.setText("⏳")
-        self.status_label.setText("generating")
-        self.status_label.setObjectName("status_generating")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                background: rgba(250, 179, 135, 0.2);
-                border: 1px solid rgba(250, 179, 135, 0.3);
-                border-radius: 12px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                color: #fab387;
-            }
-        """)
+        self.update_status("generating")
         
         # Notify main app about status change (for icon animation)
         if self.status_callback:
             self.status_callback("generating")
         
-        print("🔄 QtChatBubble: UI updated, creating worker thread...")
-        
-        # 4. Start worker thread to send request
-        self.worker = LLMWorker(self.llm_manager, message, self.current_provider, self.current_model)
-        self.worker.response_ready.connect(self.on_response_ready)
-        self.worker.error_occurred.connect(self.on_error_occurred)
+        if self.debug:
+            print("🔄 QtChatBubble: UI updated, queuing request on worker thread...")
         
-        print("🔄 QtChatBubble: Starting worker thread...")
-        self.worker.start()
+        # 4. Hand the request to the persistent worker thread
+        self.worker.submit(message, self.current_provider, self.current_model)
         
-        print("🔄 QtChatBubble: Worker thread started, hiding bubble...")
-        # Hide bubble after sending (like the original design)
-        QTimer.singleShot(500, self.hide)
+        if self.debug:
+            print("🔄 QtChatBubble: Request queued, hiding bubble...")
+        # Hide bubble right away; the request is already with the worker thread
+        self.hide()
     
     @pyqtSlot(str)
     def on_response_ready(self, response):
         """Handle LLM response."""
-        print(f"✅ QtChatBubble: on_response_ready called with response: {response[:100]}...")
+        if self.debug:
+            print(f"✅ QtChatBubble: on_response_ready called with response: {response[:100]}...")
+        
+        if self._is_full_voice_mode():
+            self._speak_voice_response(response)
+            return
         
         self.send_button.setEnabled(True)
         self.send_button.setText("→")
-        self.status_label.setText("ready")
-        self.status_label.setObjectName("status_ready")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                background: rgba(166, 227, 161, 0.2);
-                border: 1px solid rgba(166, 227, 161, 0.3);
-                border-radius: 12px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                color: #a6e3a1;
-            }
-        """)
+        self.update_status("ready")
         
         # Get updated message history from AbstractCore session
         self._update_message_history_from_session()
@@ -1116,17 +1411,8 @@ class QtChatBubble(QWidget):
                 # Update toggle state to 'speaking'
                 self._update_tts_toggle_state()
 
-                # Wait for speech to complete in a separate thread
-                def wait_for_speech():
-                    while self.voice_manager.is_speaking():
-                        time.sleep(0.1)
-                    # Update toggle state when speech completes
-                    self._update_tts_toggle_state()
-                    if self.debug:
-                        print("🔊 TTS completed")
-                
-                speech_thread = threading.Thread(target=wait_for_speech, daemon=True)
-                speech_thread.start()
+                # Update the toggle state again once speech completes
+                self._tts_poll_timer.start()
 
                 # Show chat history after TTS starts (small delay) - only if voice mode is OFF
                 QTimer.singleShot(800, self._show_history_if_voice_mode_off)
@@ -1142,7 +1428,8 @@ class QtChatBubble(QWidget):
         
         # Also call response callback if set
         if self.response_callback:
-            print(f"🔄 QtChatBubble: Response callback exists, calling it...")
+            if self.debug:
+                print("🔄 QtChatBubble: Response callback exists, calling it...")
             self.response_callback(response)
     
     def on_tts_toggled(self, enabled: bool):
@@ -1180,11 +1467,7 @@ class QtChatBubble(QWidget):
 
             if current_state == 'speaking':
                 # Pause the speech - may need multiple attempts if audio stream just started
-                success = self._attempt_pause_with_retry()
-                if success and self.debug:
-                    print("🔊 TTS paused via single click")
-                elif self.debug:
-                    print("🔊 TTS pause failed - audio stream may not be ready yet")
+                self._attempt_pause_with_retry()
             elif current_state == 'paused':
                 # Resume the speech
                 success = self.voice_manager.resume()
@@ -1204,33 +1487,36 @@ class QtChatBubble(QWidget):
             if self.debug:
                 print(f"❌ Error handling TTS single click: {e}")
 
-    def _attempt_pause_with_retry(self, max_attempts=5):
+    def _attempt_pause_with_retry(self, attempt=1, delay=10, max_attempts=5):
         """Attempt to pause with retry logic for timing issues.
 
+        Failed attempts are retried from a single-shot timer with a doubling
+        delay (10, 20, 40, 80 ms), so the UI thread never sleeps.
+
         Args:
+            attempt: Number of this attempt, starting at 1
+            delay: Milliseconds to wait before the next attempt
             max_attempts: Maximum number of pause attempts
-
-        Returns:
-            bool: True if pause succeeded, False otherwise
         """
-        import time
-
-        for attempt in range(max_attempts):
-            if not self.voice_manager.is_speaking():
-                # Speech ended while we were trying to pause
-                return False
+        if not self.voice_manager or not self.voice_manager.is_speaking():
+            # Speech ended while we were trying to pause
+            return
 
-            success = self.voice_manager.pause()
-            if success:
-                return True
+        if self.voice_manager.pause():
+            if self.debug:
+                print("🔊 TTS paused via single click")
+            self._update_tts_toggle_state()
+            return
 
+        if attempt >= max_attempts:
             if self.debug:
-                print(f"🔊 Pause attempt {attempt + 1}/{max_attempts} failed, retrying...")
+                print("🔊 TTS pause failed - audio stream may not be ready yet")
+            return
 
-            # Short delay before retry
-            time.sleep(0.1)
+        if self.debug:
+            print(f"🔊 Pause attempt {attempt}/{max_attempts} failed, retrying in {delay} ms...")
 
-        return False
+        QTimer.singleShot(delay, lambda: self._attempt_pause_with_retry(attempt + 1, delay * 2, max_attempts))
 
     def on_tts_double_click(self):
         """Handle double click on TTS toggle - stop TTS and open chat bubble."""
@@ -1240,27 +1526,20 @@ class QtChatBubble(QWidget):
         # Prevent double-free errors by checking if objects are still valid
         try:
             # Stop any current speech with proper error handling
-            if hasattr(self, 'voice_manager') and self.voice_manager and self.tts_enabled:
+            if self.voice_manager and self.tts_enabled:
                 try:
-                    # Check if voice manager is still valid before calling methods
-                    if hasattr(self.voice_manager, 'stop'):
-                        self.voice_manager.stop()
-
-                    # Safely update TTS toggle state
-                    if hasattr(self, '_update_tts_toggle_state'):
-                        self._update_tts_toggle_state()
+                    self.voice_manager.stop()
+                    self._update_tts_toggle_state()
 
                 except Exception as e:
                     if self.debug:
                         print(f"❌ Error stopping TTS on double click: {e}")
 
-            # Show the chat bubble with safety checks
-            if hasattr(self, 'show') and not self.isVisible():
+            # Show the chat bubble
+            if not self.isVisible():
                 self.show()
-            if hasattr(self, 'raise_'):
-                self.raise_()
-            if hasattr(self, 'activateWindow'):
-                self.activateWindow()
+            self.raise_()
+            self.activateWindow()
 
         except Exception as e:
             if self.debug:
@@ -1328,9 +1607,11 @@ class QtChatBubble(QWidget):
                 import traceback
                 traceback.print_exc()
 
-            # Reset toggle state on error
+            # Reset toggle state on error. This runs inside the toggle's own
+            # toggled emission, so set_enabled does not emit again: undo
+            # whatever was started (listening, greeting) explicitly
             self.full_voice_toggle.set_enabled(False)
-            self.show_text_ui()
+            self.stop_full_voice_mode()
 
     def stop_full_voice_mode(self):
         """Stop Full Voice Mode and return to normal text mode."""
@@ -1339,9 +1620,10 @@ class QtChatBubble(QWidget):
                 print("🛑 Stopping Full Voice Mode...")
 
             # Stop listening
+            self._voice_turn_pending = False
             if self.voice_manager:
                 self.voice_manager.stop_listening()
-                self.voice_manager.stop_speaking()
+                self.voice_manager.stop()
 
             # Show text input UI
             self.show_text_ui()
@@ -1359,41 +1641,53 @@ class QtChatBubble(QWidget):
                 traceback.print_exc()
 
     def handle_voice_input(self, transcribed_text: str):
-        """Handle speech-to-text input from the user."""
-        try:
+        """Handle speech-to-text input from the user.
+
+        Called on the speech-to-text thread, so the text is only handed over
+        to the UI thread; the reply comes back through on_response_ready.
+        One turn at a time: speech heard before the reply is spoken is dropped.
+        """
+        if self._voice_turn_pending:
             if self.debug:
-                print(f"👤 Voice input: {transcribed_text}")
+                print(f"🔇 Ignoring voice input while a reply is pending: {transcribed_text}")
+            return
 
-            # No longer updating voice toggle appearance - it's a simple user control
-            self.update_status("PROCESSING")
+        if self.debug:
+            print(f"👤 Voice input: {transcribed_text}")
 
-            # Generate AI response (AbstractCore will handle message logging automatically)
-            response = self.llm_manager.generate_response(
-                transcribed_text,
-                self.current_provider,
-                self.current_model
-            )
+        self._voice_turn_pending = True
+        self.voice_input_received.emit(transcribed_text)
 
-            # Update message history from AbstractCore session
-            self._update_message_history_from_session()
+    @pyqtSlot(str)
+    def _submit_voice_input(self, transcribed_text: str):
+        """Queue a transcription on the LLM worker, like a typed message."""
+        # No longer updating voice toggle appearance - it's a simple user control
+        self.update_status("PROCESSING")
 
-            if self.debug:
-                print(f"🤖 AI response: {response[:100]}...")
+        # AbstractCore will handle message logging automatically
+        self.worker.submit(transcribed_text, self.current_provider, self.current_model)
 
-            # Speak the response
-            self.voice_manager.speak(response)
+    def _speak_voice_response(self, response: str):
+        """Speak a Full Voice Mode reply and go back to listening."""
+        self._voice_turn_pending = False
 
-            # No longer updating voice toggle appearance - it's a simple user control
-            self.update_status("LISTENING")
+        # Update message history and token count from AbstractCore session
+        self._update_message_history_from_session()
+        self._update_token_count_from_session()
+
+        if self.debug:
+            print(f"🤖 AI response: {response[:100]}...")
 
+        try:
+            self.voice_manager.speak(self._clean_response_for_voice(response))
+            self._update_tts_toggle_state()
+            self._tts_poll_timer.start()
         except Exception as e:
             if self.debug:
-                print(f"❌ Error handling voice input: {e}")
-                import traceback
-                traceback.print_exc()
+                print(f"❌ Error speaking voice response: {e}")
 
-            # No longer updating voice toggle appearance - it's a simple user control
-            self.update_status("LISTENING")
+        # No longer updating voice toggle appearance - it's a simple user control
+        self.update_status("LISTENING")
 
     def handle_voice_stop(self):
         """Handle when user says 'stop' to exit Full Voice Mode."""
@@ -1406,59 +1700,60 @@ class QtChatBubble(QWidget):
     def hide_text_ui(self):
         """Hide the text input interface during Full Voice Mode."""
         # Hide the input container and other text-related UI elements
-        if hasattr(self, 'input_container'):
-            self.input_container.hide()
-
-        # Update window size to be smaller but maintain wider width
-        self.setFixedSize(630, 120)  # Reduced width by 10% to match normal size
+        self.input_container.hide()
+        self._set_bubble_height(self.VOICE_MODE_HEIGHT)
 
     def show_text_ui(self):
         """Show the text input interface when exiting Full Voice Mode."""
         # Show the input container and other text-related UI elements
-        if hasattr(self, 'input_container'):
-            self.input_container.show()
+        self.input_container.show()
+        self._set_bubble_height(self.TEXT_MODE_HEIGHT)
 
-        # Restore normal window size with wider width
-        self.setFixedSize(630, 196)
+    def _set_bubble_height(self, height: int):
+        """Resize the bubble vertically only, and only when the height changes."""
+        # The width never changes, so there is no need to re-fix both dimensions
+        if self.height() != height:
+            self.setFixedHeight(height)
 
     def update_status(self, status_text: str):
         """Update the status label with the given text."""
-        if hasattr(self, 'status_label'):
-            self.status_label.setText(status_text.upper())
-
-            # Update status label style based on status
-            if status_text.lower() in ['ready', 'idle']:
-                color = "#22c55e"  # Green
-            elif status_text.lower() in ['listening']:
-                color = "#ff6b35"  # Orange
-            elif status_text.lower() in ['processing', 'generating']:
-                color = "#ffa500"  # Yellow
-            elif status_text.lower() in ['error']:
-                color = "#ff3b30"  # Red
-            else:
-                color = "#007acc"  # Blue (default)
-
-            self.status_label.setStyleSheet(f"""
-                QLabel {{
-                    background: {color};
-                    border: none;
-                    border-radius: 12px;
-                    font-size: 10px;
-                    font-weight: 600;
-                    color: #ffffff;
-                    font-family: -apple-system, system-ui, sans-serif;
-                }}
-            """)
+        text = status_text.upper()
+        if text != self._last_status_text:
+            self.status_label.setText(text)
+            self._last_status_text = text
+
+        # Unknown statuses fall back to the default (blue) pill
+        state = self.STATUS_STATES.get(status_text.lower(), "info")
+        if self.status_label.property("state") != state:
+            self.status_label.setProperty("state", state)
+            self._repolish(self.status_label)
+
+    @staticmethod
+    def _repolish(widget):
+        """Re-evaluate stylesheet property selectors after a dynamic property change."""
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+    def _poll_tts_state(self):
+        """Stop polling and refresh the TTS controls once speech has ended."""
+        if self.voice_manager and self.voice_manager.get_state() in ('speaking', 'paused'):
+            return
+
+        self._tts_poll_timer.stop()
+        self._update_tts_toggle_state()
+        if self.debug:
+            print("🔊 TTS completed")
 
     def _update_tts_toggle_state(self):
         """Update the TTS toggle visual state based on current TTS state."""
-        if hasattr(self, 'tts_toggle') and self.voice_manager:
+        if self.tts_toggle is not None and self.voice_manager:
             try:
                 current_state = self.voice_manager.get_state()
                 # No longer updating tts_toggle appearance - it's a simple user control
 
                 # Show/hide voice control panel based on TTS state
-                if hasattr(self, 'voice_control_panel'):
+                if self.voice_control_panel is not None:
                     if current_state in ['speaking', 'paused']:
                         self.voice_control_panel.show()
                         self._update_voice_control_panel(current_state)
@@ -1478,64 +1773,25 @@ class QtChatBubble(QWidget):
         layout.setContentsMargins(4, 2, 4, 2)
         layout.setSpacing(4)
 
-        # Pause/Resume button
+        # Pause/Resume button (panel widgets are styled by BUBBLE_STYLESHEET)
         self.voice_pause_button = QPushButton("⏸")
+        self.voice_pause_button.setObjectName("voice_pause_button")
         self.voice_pause_button.setFixedSize(24, 24)
         self.voice_pause_button.setToolTip("Pause/Resume TTS (Space)")
         self.voice_pause_button.clicked.connect(self.on_tts_single_click)
-        self.voice_pause_button.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 12px;
-                font-size: 12px;
-                color: rgba(255, 255, 255, 0.9);
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.2);
-                border: 1px solid rgba(255, 255, 255, 0.3);
-            }
-            QPushButton:pressed {
-                background: rgba(255, 255, 255, 0.05);
-            }
-        """)
         layout.addWidget(self.voice_pause_button)
 
         # Stop button
         self.voice_stop_button = QPushButton("⏹")
+        self.voice_stop_button.setObjectName("voice_stop_button")
         self.voice_stop_button.setFixedSize(24, 24)
         self.voice_stop_button.setToolTip("Stop TTS (Escape)")
         self.voice_stop_button.clicked.connect(self.on_tts_double_click)
-        self.voice_stop_button.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 100, 100, 0.1);
-                border: 1px solid rgba(255, 100, 100, 0.3);
-                border-radius: 12px;
-                font-size: 12px;
-                color: rgba(255, 200, 200, 0.9);
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(255, 100, 100, 0.2);
-                border: 1px solid rgba(255, 100, 100, 0.4);
-            }
-            QPushButton:pressed {
-                background: rgba(255, 100, 100, 0.05);
-            }
-        """)
         layout.addWidget(self.voice_stop_button)
 
         # Status text
         self.voice_status_label = QLabel("Speaking...")
-        self.voice_status_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.8);
-                font-size: 10px;
-                font-weight: 500;
-                padding: 2px 4px;
-            }
-        """)
+        self.voice_status_label.setObjectName("voice_status_label")
         layout.addWidget(self.voice_status_label)
 
         panel.setLayout(layout)
@@ -1543,7 +1799,7 @@ class QtChatBubble(QWidget):
 
     def _update_voice_control_panel(self, state):
         """Update the voice control panel based on TTS state."""
-        if not hasattr(self, 'voice_control_panel'):
+        if self.voice_control_panel is None:
             return
 
         if state == 'speaking':
@@ -1558,19 +1814,18 @@ class QtChatBubble(QWidget):
     def setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts for voice control."""
         try:
-            from PyQt5.QtWidgets import QShortcut
-            from PyQt5.QtGui import QKeySequence
+            # Shift/Ctrl/Cmd+Enter sending is handled by eventFilter
 
             # Space bar - Pause/Resume TTS
-            self.space_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Space), self)
+            self.space_shortcut = QShortcut(QKeySequence("Space"), self)
             self.space_shortcut.activated.connect(self.handle_space_shortcut)
 
             # Escape - Stop TTS
-            self.escape_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
+            self.escape_shortcut = QShortcut(QKeySequence("Escape"), self)
             self.escape_shortcut.activated.connect(self.handle_escape_shortcut)
 
             if self.debug:
-                print("✅ Keyboard shortcuts setup: Space (pause/resume), Escape (stop)")
+                print("✅ Keyboard shortcuts setup: Shift+Enter (send), Space (pause/resume), Escape (stop)")
 
         except Exception as e:
             if self.debug:
@@ -1594,48 +1849,7 @@ class QtChatBubble(QWidget):
     
     def _clean_response_for_voice(self, text: str) -> str:
         """Clean response text for voice synthesis - remove formatting and make conversational."""
-        import re
-        
-        # Remove markdown headers
-        text = re.sub(r'^#+\s*', '', text, flags=re.MULTILINE)
-        
-        # Remove markdown formatting
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Italic
-        text = re.sub(r'_([^_]+)_', r'\1', text)        # Underscore
-        
-        # Remove code blocks completely
-        text = re.sub(r'```[\s\S]*?```', '', text)
-        text = re.sub(r'`([^`]+)`', r'\1', text)
-        
-        # Remove bullet points and lists
-        text = re.sub(r'^[-*+]\s+', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^\d+\.\s+', '', text, flags=re.MULTILINE)
-        
-        # Remove markdown links
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-        
-        # Replace special characters with words
-        replacements = {
-            '&': ' and ',
-            '@': ' at ',
-            '#': ' hash ',
-            '$': ' dollar ',
-            '%': ' percent ',
-            '→': ' to ',
-            '←': ' from ',
-            '+': ' plus ',
-            '/': ' or ',
-            '|': ' or ',
-        }
-        
-        for symbol, word in replacements.items():
-            text = text.replace(symbol, word)
-        
-        # Clean up whitespace and line breaks
-        text = re.sub(r'\n+', ' ', text)  # Replace line breaks with spaces
-        text = re.sub(r'\s+', ' ', text)  # Collapse multiple spaces
-        text = text.strip()
+        text = clean_text_for_voice(text)
         
         # NO TRUNCATION - let the LLM decide response length based on system prompt
         
@@ -1647,27 +1861,32 @@ class QtChatBubble(QWidget):
     @pyqtSlot(str)
     def on_error_occurred(self, error):
         """Handle LLM error."""
+        if self._is_full_voice_mode():
+            # A failed voice turn just goes back to listening
+            self._voice_turn_pending = False
+            if self.debug:
+                print(f"❌ Error handling voice input: {error}")
+            self.update_status("LISTENING")
+            return
+
         self.send_button.setEnabled(True)
         self.send_button.setText("→")
-        self.status_label.setText("error")
-        self.status_label.setObjectName("status_error")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                background: rgba(243, 139, 168, 0.2);
-                border: 1px solid rgba(243, 139, 168, 0.3);
-                border-radius: 12px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                color: #f38ba8;
-            }
-        """)
+        self.update_status("error")
         
         if self.debug:
             print(f"Error occurred: {error}")
         
+        # Report a burst of queued failures once instead of per error
+        self._pending_error = error
+        if not self._error_timer.isActive():
+            self._error_timer.start()
+    
+    def _flush_error(self):
+        """Report the latest pending LLM error."""
+        error, self._pending_error = self._pending_error, None
+        if error is None:
+            return
+        
         # Show chat history instead of error toast
         if self.debug:
             print(f"❌ AI Error: {error}")
@@ -1702,10 +1921,6 @@ class QtChatBubble(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            if hasattr(self, 'chat_display'):
-                self.chat_display.clear()
-                self.chat_display.hide()
-
             # Clear AbstractCore session and create a new one
             if self.llm_manager:
                 self.llm_manager.create_new_session()
@@ -1713,6 +1928,7 @@ class QtChatBubble(QWidget):
                     print("🧹 AbstractCore session cleared and recreated")
 
             self.message_history.clear()
+            self._history_session = None
             self.token_count = 0
             self.update_token_display()
 
@@ -1816,14 +2032,18 @@ class QtChatBubble(QWidget):
                 if self.debug:
                     print(f"❌ Failed to save session: {e}")
     
+    def _is_full_voice_mode(self):
+        """Check if Full Voice Mode (continuous listening) is on."""
+        return self.full_voice_toggle is not None and self.full_voice_toggle.is_enabled()
+
     def _is_voice_mode_active(self):
         """Centralized source of truth: Check if ANY voice mode is active."""
         # Check Full Voice Mode (listening/speaking conversations)
-        if hasattr(self, 'full_voice_toggle') and self.full_voice_toggle and self.full_voice_toggle.is_enabled():
+        if self._is_full_voice_mode():
             return True
 
         # Check if TTS is currently speaking
-        if hasattr(self, 'voice_manager') and self.voice_manager:
+        if self.voice_manager:
             try:
                 if self.voice_manager.is_speaking():
                     return True
@@ -1838,27 +2058,39 @@ class QtChatBubble(QWidget):
         return not self._is_voice_mode_active()
 
     def _update_message_history_from_session(self):
-        """Update local message history from AbstractCore session."""
+        """Update local message history from AbstractCore session.
+
+        Session messages are only ever appended, so only the ones added since
+        the last update are converted; a different session is mirrored afresh.
+        """
         if self.llm_manager and self.llm_manager.current_session:
             try:
                 # Get messages from AbstractCore session
-                session_messages = getattr(self.llm_manager.current_session, 'messages', [])
+                session = self.llm_manager.current_session
+                session_messages = getattr(session, 'messages', [])
+
+                if session is not self._history_session or len(session_messages) < self._history_synced:
+                    self.message_history = []
+                    self._history_session = session
+                    self._history_synced = 0
 
-                # Convert AbstractCore messages to our format
-                self.message_history = []
-                for msg in session_messages:
+                # Convert new AbstractCore messages to our format
+                for msg in session_messages[self._history_synced:]:
                     # Skip system messages
                     if hasattr(msg, 'role') and msg.role == 'system':
                         continue
 
                     message = {
-                        'timestamp': datetime.now().isoformat(),  # AbstractCore doesn't store timestamps
+                        # AbstractCore doesn't store timestamps; the history dialog
+                        # formats the raw epoch seconds only when it is shown
+                        'timestamp': time.time(),
                         'type': getattr(msg, 'role', 'unknown'),
                         'content': getattr(msg, 'content', str(msg)),
                         'provider': self.current_provider,
                         'model': self.current_model
                     }
                     self.message_history.append(message)
+                self._history_synced = len(session_messages)
 
                 if self.debug:
                     print(f"📚 Updated message history from AbstractCore: {len(self.message_history)} messages")
@@ -1938,41 +2170,10 @@ class QtChatBubble(QWidget):
 
     def _update_history_button_appearance(self, is_active: bool):
         """Update history button appearance to show toggle state."""
-        if hasattr(self, 'history_button'):
-            if is_active:
-                # Active state - highlighted
-                self.history_button.setStyleSheet("""
-                    QPushButton {
-                        background: rgba(0, 122, 255, 0.8);
-                        border: none;
-                        border-radius: 11px;
-                        font-size: 10px;
-                        color: #ffffff;
-                        font-family: -apple-system, system-ui, sans-serif;
-                        padding: 0 10px;
-                        font-weight: 600;
-                    }
-                    QPushButton:hover {
-                        background: rgba(0, 122, 255, 1.0);
-                    }
-                """)
-            else:
-                # Inactive state - normal
-                self.history_button.setStyleSheet("""
-                    QPushButton {
-                        background: rgba(255, 255, 255, 0.06);
-                        border: none;
-                        border-radius: 11px;
-                        font-size: 10px;
-                        color: rgba(255, 255, 255, 0.7);
-                        font-family: -apple-system, system-ui, sans-serif;
-                        padding: 0 10px;
-                    }
-                    QPushButton:hover {
-                        background: rgba(255, 255, 255, 0.1);
-                        color: rgba(255, 255, 255, 0.9);
-                    }
-                """)
+        if self.history_button is not None and self.history_button.property("active") != is_active:
+            # Highlight comes from the #session_button[active="true"] rules
+            self.history_button.setProperty("active", is_active)
+            self._repolish(self.history_button)
 
     def close_app(self):
         """Close the entire application completely."""
@@ -1980,18 +2181,18 @@ class QtChatBubble(QWidget):
             print("🔄 Close button clicked - shutting down application")
 
         # Stop TTS if running
-        if hasattr(self, 'voice_manager') and self.voice_manager:
+        if self.voice_manager:
             self.voice_manager.cleanup()
 
         # Close the chat bubble
         self.hide()
 
         # Close history dialog if open
-        if hasattr(self, 'history_dialog') and self.history_dialog:
+        if self.history_dialog:
             self.history_dialog.hide()
 
         # ALWAYS try to call the app quit callback first
-        if hasattr(self, 'app_quit_callback') and self.app_quit_callback:
+        if self.app_quit_callback:
             if self.debug:
                 print("🔄 Calling app quit callback")
             try:
@@ -2013,7 +2214,6 @@ class QtChatBubble(QWidget):
             app.processEvents()
 
         # Force exit if the app is still running
-        import sys
         import os
         if self.debug:
             print("🔄 Force exit with sys.exit and os._exit")
@@ -2030,9 +2230,20 @@ class QtChatBubble(QWidget):
     
     def closeEvent(self, event):
         """Handle close event."""
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
+        # Discovery and voice setup cannot be interrupted; let them finish
+        # before the thread objects go away
+        if self._discovery_worker and self._discovery_worker.isRunning():
+            self._discovery_worker.wait(2000)
+        if self._voice_init_worker and self._voice_init_worker.isRunning():
+            self._voice_init_worker.wait(2000)
+
+        if self.worker.isRunning():
+            self.worker.stop()
+            # Give an in-flight request a moment to finish; only force a worker
+            # stuck in a provider call, and never block the close indefinitely
+            if not self.worker.wait(1000):
+                self.worker.terminate()
+                self.worker.wait(500)
         
         # Clean up voice manager
         if self.voice_manager:
@@ -2059,6 +2270,7 @@ class QtBubbleManager:
         self.response_callback = None
         self.error_callback = None
         self.status_callback = None
+        self.app_quit_callback = None
         
         if not QT_AVAILABLE:
             raise RuntimeError("No Qt library available. Install PyQt5, PySide2, or PyQt6")
@@ -2069,11 +2281,8 @@ class QtBubbleManager:
     def _prepare_bubble(self):
         """Pre-initialize the bubble for instant display later."""
         if not self.app:
-            # Create QApplication if it doesn't exist
-            if not QApplication.instance():
-                self.app = QApplication(sys.argv)
-            else:
-                self.app = QApplication.instance()
+            # Reuse the running QApplication, creating one only if needed
+            self.app = QApplication.instance() or QApplication(sys.argv)
 
         if not self.bubble:
             if self.debug:
@@ -2083,12 +2292,7 @@ class QtBubbleManager:
             self.bubble = QtChatBubble(self.llm_manager, self.config, self.debug, self.listening_mode)
 
             # Set up callbacks
-            if self.response_callback:
-                self.bubble.set_response_callback(self.response_callback)
-            if self.error_callback:
-                self.bubble.set_error_callback(self.error_callback)
-            if self.status_callback:
-                self.bubble.set_status_callback(self.status_callback)
+            self._apply_callbacks()
 
             if self.debug:
                 print("✅ QtChatBubble pre-created and ready")
@@ -2098,12 +2302,8 @@ class QtBubbleManager:
         # Ensure bubble is prepared (will be instant if already pre-initialized)
         if not self.bubble:
             self._prepare_bubble()
-
-        # Set app quit callback if not already set during preparation
-        if hasattr(self, 'app_quit_callback') and self.app_quit_callback:
-            if hasattr(self.bubble, 'set_app_quit_callback'):
-                self.bubble.set_app_quit_callback(self.app_quit_callback)
         
+        # The bubble is kept alive between opens: just show the existing widget
         self.bubble.show()
         self.bubble.raise_()
         self.bubble.activateWindow()
@@ -2119,8 +2319,14 @@ class QtBubbleManager:
             if self.debug:
                 print("💬 Qt chat bubble hidden")
     
+    def reload_providers(self):
+        """Re-run provider and model discovery on the existing bubble."""
+        ProviderManager.clear_cache()
+        if self.bubble:
+            self.bubble.load_providers()
+    
     def destroy(self):
-        """Destroy the chat bubble."""
+        """Destroy the chat bubble (application exit only)."""
         if self.bubble:
             self.bubble.close()
             self.bubble = None
@@ -2128,6 +2334,38 @@ class QtBubbleManager:
             if self.debug:
                 print("💬 Qt chat bubble destroyed")
     
+    def set_callbacks(self, response=None, error=None, status=None, app_quit=None):
+        """Set several callbacks at once, updating the bubble a single time.
+
+        Args:
+            response: Called with the LLM response text
+            error: Called with the error message
+            status: Called with the new status string
+            app_quit: Called when the user quits from the bubble
+        """
+        if response:
+            self.response_callback = response
+        if error:
+            self.error_callback = error
+        if status:
+            self.status_callback = status
+        if app_quit:
+            self.app_quit_callback = app_quit
+        self._apply_callbacks()
+    
+    def _apply_callbacks(self):
+        """Hand the stored callbacks to the bubble, if it exists."""
+        if not self.bubble:
+            return
+        if self.response_callback:
+            self.bubble.set_response_callback(self.response_callback)
+        if self.error_callback:
+            self.bubble.set_error_callback(self.error_callback)
+        if self.status_callback:
+            self.bubble.set_status_callback(self.status_callback)
+        if self.app_quit_callback:
+            self.bubble.set_app_quit_callback(self.app_quit_callback)
+    
     def set_response_callback(self, callback):
         """Set response callback."""
         self.response_callback = callback
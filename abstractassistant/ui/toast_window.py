@@ -6,6 +6,7 @@ positioned in the top-right corner with expand/collapse functionality.
 """
 
 import sys
+from importlib.util import find_spec
 from typing import Optional
 import pyperclip
 
@@ -23,27 +24,23 @@ except ImportError:
         def render_markdown(text):
             return f"<pre>{text}</pre>"
 
-print(f"🔍 Toast Window: MARKDOWN_AVAILABLE = {MARKDOWN_AVAILABLE}")
+# Pick the installed binding up front instead of failing imports in turn
+QT_AVAILABLE = next((name for name in ("PyQt5", "PySide2") if find_spec(name)), None)
 
-try:
+if QT_AVAILABLE == "PyQt5":
     from PyQt5.QtWidgets import (
         QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
         QTextEdit, QTextBrowser, QPushButton, QLabel, QFrame, QScrollArea
     )
     from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QRect, QEasingCurve
     from PyQt5.QtGui import QFont, QPalette, QColor, QTextCursor
-    QT_AVAILABLE = "PyQt5"
-except ImportError:
-    try:
-        from PySide2.QtWidgets import (
-            QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-            QTextEdit, QTextBrowser, QPushButton, QLabel, QFrame, QScrollArea
-        )
-        from PySide2.QtCore import Qt, QTimer, QPropertyAnimation, QRect, QEasingCurve
-        from PySide2.QtGui import QFont, QPalette, QColor, QTextCursor
-        QT_AVAILABLE = "PySide2"
-    except ImportError:
-        QT_AVAILABLE = None
+elif QT_AVAILABLE == "PySide2":
+    from PySide2.QtWidgets import (
+        QApplication, QWidget, QVBoxLayout, QHBoxLayout,
+        QTextEdit, QTextBrowser, QPushButton, QLabel, QFrame, QScrollArea
+    )
+    from PySide2.QtCore import Qt, QTimer, QPropertyAnimation, QRect, QEasingCurve
+    from PySide2.QtGui import QFont, QPalette, QColor, QTextCursor
 
 
 class ToastWindow(QWidget):
@@ -217,6 +214,28 @@ class ToastWindow(QWidget):
         self.content_area.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse | Qt.TextInteractionFlag.TextSelectableByKeyboard)
         
         # Set the message content with markdown rendering
+        self._render_message()
+        
+        # Content area is read-only, no click-to-expand (only close button closes)
+        
+        layout.addWidget(self.content_area)
+        
+        # No reply panel - use main chat bubble for new messages
+        
+        self.setLayout(layout)
+    
+    def set_message(self, message: str):
+        """Replace the displayed message, reusing this window.
+
+        Args:
+            message: New message text (markdown)
+        """
+        self.message = message
+        self._render_message()
+        self._update_playback_buttons()
+    
+    def _render_message(self):
+        """Render self.message into the content area."""
         if MARKDOWN_AVAILABLE:
             try:
                 html_content = render_markdown(self.message)
@@ -233,14 +252,6 @@ class ToastWindow(QWidget):
             if self.debug:
                 print("❌ Markdown not available, using plain text")
             self.content_area.setPlainText(self.message)
-        
-        # Content area is read-only, no click-to-expand (only close button closes)
-        
-        layout.addWidget(self.content_area)
-        
-        # No reply panel - use main chat bubble for new messages
-        
-        self.setLayout(layout)
     
     # Reply panel functionality removed - use main chat bubble for new messages
     
@@ -517,13 +528,11 @@ class ToastManager:
     
     def show_response(self, message: str, auto_hide_seconds: int = 0):
         """Show a response toast notification - stays visible until manually closed."""
-        # Close existing toast
+        # Reuse the existing toast window instead of building a new one
         if self.current_toast:
-            self.current_toast.hide()
-            self.current_toast.deleteLater()
-        
-        # Create new toast
-        self.current_toast = ToastWindow(message, debug=self.debug)
+            self.current_toast.set_message(message)
+        else:
+            self.current_toast = ToastWindow(message, debug=self.debug)
         self.current_toast.show_toast()  # No auto-hide
         
         if self.debug:
@@ -539,44 +548,40 @@ class ToastManager:
             self.current_toast.hide_toast()
 
 
-# Global reference to keep toast windows alive and prevent garbage collection
-_active_toasts = []
+# Global reference to keep the shared toast window alive and reusable
+_current_toast: Optional[ToastWindow] = None
 
 # Standalone function to show a toast (can be called from anywhere)
 def show_toast_notification(message: str, debug: bool = False, voice_manager=None):
     """Standalone function to show a toast notification - stays visible until manually closed."""
+    global _current_toast
     try:
         # Create a minimal QApplication if none exists
         app = QApplication.instance()
         if not app:
             app = QApplication(sys.argv)
 
-        # Create and show toast (no auto-hide)
-        toast = ToastWindow(message, debug=debug, voice_manager=voice_manager)
-        
-        # Keep a global reference to prevent garbage collection
-        _active_toasts.append(toast)
-        
-        # Connect close event to remove from active list
-        def on_toast_closed():
-            if toast in _active_toasts:
-                _active_toasts.remove(toast)
-            if debug:
-                print(f"🍞 Toast removed from active list, {len(_active_toasts)} remaining")
-        
-        # Override the hide_toast method to call our cleanup
-        original_hide = toast.hide_toast
-        def hide_with_cleanup():
-            original_hide()
-            on_toast_closed()
-        toast.hide_toast = hide_with_cleanup
+        # Reuse one toast window; toasts share a position, so a new one
+        # would only cover the previous anyway
+        toast = _current_toast
+        if toast is None or toast.voice_manager is not voice_manager:
+            # Playback buttons are built with the window, so a different
+            # voice manager needs a fresh one
+            if toast is not None:
+                toast.hide()
+                toast.deleteLater()
+            toast = ToastWindow(message, debug=debug, voice_manager=voice_manager)
+            _current_toast = toast
+        else:
+            toast.debug = debug
+            toast.set_message(message)
         
         # Reply functionality removed - use main chat bubble for new messages
         
         toast.show_toast()
         
         if debug:
-            print(f"🍞 Standalone toast shown: {message[:50]}... (Active toasts: {len(_active_toasts)})")
+            print(f"🍞 Standalone toast shown: {message[:50]}...")
         
         return toast
         
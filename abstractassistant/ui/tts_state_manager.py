@@ -20,6 +20,27 @@ class TTSState(Enum):
 class TTSStateManager:
     """Manages TTS state coordination between VoiceManager and UI components."""
 
+    # VoiceManager state string -> TTSState (anything else counts as idle)
+    VOICE_STATES = {
+        'speaking': TTSState.SPEAKING,
+        'paused': TTSState.PAUSED,
+        'idle': TTSState.IDLE,
+    }
+
+    # Status label text and UIStyles status style per state
+    STATUS_TEXT = {
+        TTSState.IDLE: "TTS Ready",
+        TTSState.SPEAKING: "Speaking...",
+        TTSState.PAUSED: "TTS Paused",
+        TTSState.DISABLED: "TTS Disabled"
+    }
+    STATUS_STYLE = {
+        TTSState.IDLE: "ready",
+        TTSState.SPEAKING: "generating",
+        TTSState.PAUSED: "error",  # Use warning color for paused
+        TTSState.DISABLED: "idle"
+    }
+
     def __init__(self, voice_manager=None, debug: bool = False):
         """Initialize the TTS state manager.
 
@@ -94,14 +115,7 @@ class TTSStateManager:
             voice_state = self.voice_manager.get_state()
 
             # Map voice manager states to our enum
-            if voice_state == 'speaking':
-                return TTSState.SPEAKING
-            elif voice_state == 'paused':
-                return TTSState.PAUSED
-            elif voice_state == 'idle':
-                return TTSState.IDLE
-            else:
-                return TTSState.IDLE
+            return self.VOICE_STATES.get(voice_state, TTSState.IDLE)
 
         except Exception as e:
             if self.debug:
@@ -163,32 +177,12 @@ class TTSStateManager:
         try:
             from .ui_styles import UIStyles
 
-            status_text = {
-                TTSState.IDLE: "TTS Ready",
-                TTSState.SPEAKING: "Speaking...",
-                TTSState.PAUSED: "TTS Paused",
-                TTSState.DISABLED: "TTS Disabled"
-            }
-
-            status_style = {
-                TTSState.IDLE: "ready",
-                TTSState.SPEAKING: "generating",
-                TTSState.PAUSED: "error",  # Use warning color for paused
-                TTSState.DISABLED: "idle"
-            }
-
-            self.status_label.setText(status_text.get(state, "Unknown"))
-            self.status_label.setStyleSheet(UIStyles.get_status_style(status_style.get(state, "idle")))
+            self.status_label.setText(self.STATUS_TEXT.get(state, "Unknown"))
+            self.status_label.setStyleSheet(UIStyles.get_status_style(self.STATUS_STYLE.get(state, "idle")))
 
         except ImportError:
             # Fallback without styling
-            status_text = {
-                TTSState.IDLE: "TTS Ready",
-                TTSState.SPEAKING: "Speaking...",
-                TTSState.PAUSED: "TTS Paused",
-                TTSState.DISABLED: "TTS Disabled"
-            }
-            self.status_label.setText(status_text.get(state, "Unknown"))
+            self.status_label.setText(self.STATUS_TEXT.get(state, "Unknown"))
 
     def pause_resume_toggle(self) -> bool:
         """Toggle between pause and resume based on current state.
@@ -0,0 +1,68 @@
+"""
+Text cleanup for voice synthesis in AbstractAssistant.
+
+Strips markdown from LLM replies and spells out symbols so TTS reads
+them naturally. Has no Qt or voice dependencies.
+"""
+
+import re
+
+
+# Markdown cleanup applied before TTS, in order: (compiled pattern, replacement)
+VOICE_CLEANUP_PATTERNS = [
+    (re.compile(r'^#+\s*', re.MULTILINE), ''),           # Headers
+    (re.compile(r'\*\*([^*]+)\*\*'), r'\1'),             # Bold
+    (re.compile(r'\*([^*]+)\*'), r'\1'),                 # Italic
+    (re.compile(r'_([^_]+)_'), r'\1'),                   # Underscore
+    (re.compile(r'```[\s\S]*?```'), ''),                 # Code blocks, removed completely
+    (re.compile(r'`([^`]+)`'), r'\1'),                   # Inline code
+    (re.compile(r'^[-*+]\s+', re.MULTILINE), ''),        # Bullet points
+    (re.compile(r'^\d+\.\s+', re.MULTILINE), ''),        # Numbered lists
+    (re.compile(r'\[([^\]]+)\]\([^\)]+\)'), r'\1'),      # Links
+]
+
+# Special characters spoken as words, replaced in a single pass
+VOICE_SYMBOL_WORDS = {
+    '&': ' and ',
+    '@': ' at ',
+    '#': ' hash ',
+    '$': ' dollar ',
+    '%': ' percent ',
+    '→': ' to ',
+    '←': ' from ',
+    '+': ' plus ',
+    '/': ' or ',
+    '|': ' or ',
+}
+VOICE_SYMBOL_RE = re.compile('|'.join(map(re.escape, VOICE_SYMBOL_WORDS)))
+
+# Line breaks and runs of whitespace collapse to a single space
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Anything the cleanup above could change: markdown or symbol characters,
+# whitespace other than single spaces, or a leading list marker
+VOICE_MARKUP_RE = re.compile(r'[*_`#\[&@$%→←+/|]|[^\S ]|\s\s|^(?:-|\d+\.)\s')
+
+
+def clean_text_for_voice(text: str) -> str:
+    """Clean text for voice synthesis - remove formatting and make conversational.
+
+    Args:
+        text: Reply text, possibly containing markdown
+
+    Returns:
+        Single-line text ready to be spoken
+    """
+    # Plain replies (the usual case with the TTS system prompt) need no cleanup passes
+    if not VOICE_MARKUP_RE.search(text):
+        return text.strip()
+
+    # Remove markdown headers, formatting, code, lists and links
+    for pattern, replacement in VOICE_CLEANUP_PATTERNS:
+        text = pattern.sub(replacement, text)
+
+    # Replace special characters with words
+    text = VOICE_SYMBOL_RE.sub(lambda match: VOICE_SYMBOL_WORDS[match.group(0)], text)
+
+    # Clean up whitespace and line breaks
+    return WHITESPACE_RE.sub(' ', text).strip()
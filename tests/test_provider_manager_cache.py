@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the ProviderManager discovery cache.
+
+AbstractCore discovery is replaced by counting fakes, so these tests need
+AbstractCore installed but no running provider.
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("abstractcore")
+
+from abstractassistant.ui import provider_manager
+from abstractassistant.ui.provider_manager import ProviderManager
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def discovery(monkeypatch):
+    """Count calls into AbstractCore discovery and control the cache clock."""
+    calls = {'providers': 0, 'models': 0}
+
+    def fake_list_available_providers():
+        calls['providers'] += 1
+        return ['lmstudio', 'ollama', 'mock']
+
+    class FakeLLM:
+        def list_available_models(self):
+            return ['model-a', 'model-b']
+
+    def fake_create_llm(provider, model=None):
+        calls['models'] += 1
+        return FakeLLM()
+
+    clock = FakeClock()
+    monkeypatch.setattr(provider_manager, "list_available_providers", fake_list_available_providers)
+    monkeypatch.setattr(provider_manager, "create_llm", fake_create_llm)
+    monkeypatch.setattr(provider_manager.time, "monotonic", clock)
+
+    ProviderManager.clear_cache()
+    yield calls, clock
+    ProviderManager.clear_cache()
+
+
+def test_cache_hit(discovery):
+    """A second lookup within the TTL is served from the cache."""
+    calls, clock = discovery
+    manager = ProviderManager()
+
+    providers = manager.get_available_providers()
+    assert providers == [('LMStudio', 'lmstudio'), ('Ollama', 'ollama')]
+    assert manager.get_models_for_provider('lmstudio') == ['model-a', 'model-b']
+
+    clock.now += ProviderManager.DISCOVERY_TTL - 1
+    assert ProviderManager().get_available_providers() == providers
+    assert manager.get_models_for_provider('lmstudio') == ['model-a', 'model-b']
+    assert calls == {'providers': 1, 'models': 1}
+
+
+def test_cache_returns_copies(discovery):
+    """Callers mutating a result do not change the cached entry."""
+    calls, clock = discovery
+    manager = ProviderManager()
+
+    manager.get_models_for_provider('ollama').append('extra')
+    assert manager.get_models_for_provider('ollama') == ['model-a', 'model-b']
+    assert calls['models'] == 1
+
+
+def test_cache_expires_after_ttl(discovery):
+    """Once DISCOVERY_TTL has passed, AbstractCore is queried again."""
+    calls, clock = discovery
+    manager = ProviderManager()
+
+    manager.get_available_providers()
+    manager.get_models_for_provider('lmstudio')
+
+    clock.now += ProviderManager.DISCOVERY_TTL
+    manager.get_available_providers()
+    manager.get_models_for_provider('lmstudio')
+    assert calls == {'providers': 2, 'models': 2}
+
+
+def test_clear_cache(discovery):
+    """clear_cache forces the next lookup to query AbstractCore."""
+    calls, clock = discovery
+    manager = ProviderManager()
+
+    manager.get_available_providers()
+    manager.get_models_for_provider('lmstudio')
+    ProviderManager.clear_cache()
+    manager.get_available_providers()
+    manager.get_models_for_provider('lmstudio')
+    assert calls == {'providers': 2, 'models': 2}
+
+
+def test_concurrent_lookups_run_one_at_a_time(monkeypatch):
+    """Threads asking for models never instantiate providers side by side,
+    and a provider fetched while another thread waited is not fetched again."""
+    state = {'active': 0, 'peak': 0, 'calls': 0}
+    state_lock = threading.Lock()
+
+    class SlowLLM:
+        def list_available_models(self):
+            return ['model-a']
+
+    def slow_create_llm(provider, model=None):
+        with state_lock:
+            state['calls'] += 1
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(0.05)
+        with state_lock:
+            state['active'] -= 1
+        return SlowLLM()
+
+    monkeypatch.setattr(provider_manager, "create_llm", slow_create_llm)
+    ProviderManager.clear_cache()
+    try:
+        providers = ['lmstudio', 'lmstudio', 'ollama', 'ollama']
+        threads = [threading.Thread(target=ProviderManager().get_models_for_provider, args=(p,))
+                   for p in providers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        ProviderManager.clear_cache()
+
+    assert state['peak'] == 1
+    assert state['calls'] == 2
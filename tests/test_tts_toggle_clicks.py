@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for single/double click handling on the TTS toggle.
+
+A double click must open the chat without toggling TTS, since toggling
+recreates the LLM session and would wipe the conversation.
+"""
+
+from importlib import import_module
+from importlib.util import find_spec
+from types import SimpleNamespace
+
+import pytest
+
+if not any(find_spec(binding) for binding in ("PyQt5", "PySide2", "PyQt6")):
+    pytest.skip("no Qt binding installed", allow_module_level=True)
+
+qt_bubble = pytest.importorskip("abstractassistant.ui.qt_bubble")
+
+QtCore = import_module(f"{qt_bubble.QT_AVAILABLE}.QtCore")
+QtGui = import_module(f"{qt_bubble.QT_AVAILABLE}.QtGui")
+QtTest = import_module(f"{qt_bubble.QT_AVAILABLE}.QtTest")
+
+Qt = qt_bubble.Qt
+QEvent = qt_bubble.QEvent
+QApplication = qt_bubble.QApplication
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+class FakeLLMManager:
+    """Counts session resets made by the TTS toggled handler."""
+
+    def __init__(self):
+        self.sessions_created = 0
+
+    def create_new_session(self, tts_mode=False):
+        self.sessions_created += 1
+
+
+@pytest.fixture
+def toggle(app):
+    """A TTS toggle wired to QtChatBubble.on_tts_toggled with a fake LLM manager."""
+    toggle = qt_bubble.TTSToggle()
+    bubble = SimpleNamespace(tts_enabled=False, debug=False, voice_manager=None,
+                             llm_manager=FakeLLMManager())
+    toggle.toggled.connect(lambda enabled: qt_bubble.QtChatBubble.on_tts_toggled(bubble, enabled))
+    toggle.double_clicks = []
+    toggle.double_clicked.connect(lambda: toggle.double_clicks.append(True))
+    toggle.bubble = bubble
+    return toggle
+
+
+def send_mouse(widget, event_type, buttons):
+    """Deliver one left-button mouse event to the widget."""
+    pos = QtCore.QPointF(widget.rect().center())
+    event = QtGui.QMouseEvent(event_type, pos, QtCore.QPointF(widget.mapToGlobal(widget.rect().center())),
+                              Qt.MouseButton.LeftButton, buttons, Qt.KeyboardModifier.NoModifier)
+    QApplication.sendEvent(widget, event)
+
+
+def click(widget):
+    send_mouse(widget, QEvent.Type.MouseButtonPress, Qt.MouseButton.LeftButton)
+    send_mouse(widget, QEvent.Type.MouseButtonRelease, Qt.MouseButton.NoButton)
+
+
+def double_click(widget):
+    """Press/release followed by the double-click event Qt sends in place of the second press."""
+    click(widget)
+    send_mouse(widget, QEvent.Type.MouseButtonDblClick, Qt.MouseButton.LeftButton)
+    send_mouse(widget, QEvent.Type.MouseButtonRelease, Qt.MouseButton.NoButton)
+
+
+def wait_past_double_click_interval():
+    QtTest.QTest.qWait(QApplication.doubleClickInterval() + 100)
+
+
+def test_single_click_shows_new_state_at_once(toggle):
+    click(toggle)
+    assert toggle.isChecked()
+    assert toggle.text() == "🔉"
+
+    wait_past_double_click_interval()
+    assert toggle.is_enabled()
+    assert toggle.bubble.tts_enabled
+    assert toggle.bubble.llm_manager.sessions_created == 1
+    assert toggle.double_clicks == []
+
+
+def test_double_click_leaves_tts_and_session_unchanged(toggle):
+    double_click(toggle)
+    wait_past_double_click_interval()
+
+    assert toggle.double_clicks == [True]
+    assert not toggle.is_enabled()
+    assert not toggle.isChecked()
+    assert toggle.text() == "🔇"
+    assert not toggle.bubble.tts_enabled
+    assert toggle.bubble.llm_manager.sessions_created == 0
+
+
+def test_double_click_while_enabled_keeps_tts_on(toggle):
+    toggle.set_enabled(True)
+    toggle.bubble.llm_manager.sessions_created = 0
+
+    double_click(toggle)
+    wait_past_double_click_interval()
+
+    assert toggle.double_clicks == [True]
+    assert toggle.is_enabled()
+    assert toggle.isChecked()
+    assert toggle.bubble.llm_manager.sessions_created == 0
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the text cleanup applied before voice synthesis.
+
+Plain Python: no Qt, AbstractCore or AbstractVoice needed.
+"""
+
+import pytest
+
+from abstractassistant.utils.voice_text import clean_text_for_voice
+
+
+@pytest.mark.parametrize("text, expected", [
+    # Markdown
+    ("# Title\n## Subtitle", "Title Subtitle"),
+    ("This is **bold** and *italic* and _underlined_.", "This is bold and italic and underlined."),
+    ("Run `pip install` first.", "Run pip install first."),
+    ("See [the docs](https://example.com/docs) for more.", "See the docs for more."),
+    ("- first\n* second\n+ third", "first second third"),
+    ("1. one\n2. two", "one two"),
+    # Code blocks are dropped entirely
+    ("Try this:\n```python\nprint('hello')\n```\nThen run it.", "Try this: Then run it."),
+    ("```\na = b * c\n```", ""),
+    # Symbols spoken as words
+    ("Tom & Jerry", "Tom and Jerry"),
+    ("me@example", "me at example"),
+    ("Item #3", "Item hash 3"),
+    ("$5 is 50% off", "dollar 5 is 50 percent off"),
+    ("A → B ← C", "A to B from C"),
+    ("1+1", "1 plus 1"),
+    ("yes/no|maybe", "yes or no or maybe"),
+    # Plain text only loses surrounding whitespace
+    ("Hello there, how can I help?", "Hello there, how can I help?"),
+    ("  Sure.  ", "Sure."),
+    ("", ""),
+    # Line breaks and runs of whitespace collapse
+    ("Line one.\nLine two.\n\n\tLine three.", "Line one. Line two. Line three."),
+])
+def test_clean_text_for_voice(text, expected):
+    assert clean_text_for_voice(text) == expected
+
+
+def test_mixed_reply():
+    """A typical markdown reply reads as one clean sentence stream."""
+    reply = (
+        "## Summary\n"
+        "\n"
+        "Here are the **key** points:\n"
+        "\n"
+        "1. Install with `pip`\n"
+        "2. Read [the guide](http://x.y/guide)\n"
+        "\n"
+        "```bash\n"
+        "pip install abstractassistant\n"
+        "```\n"
+        "\n"
+        "That's 100% of it & you're done → enjoy!"
+    )
+    assert clean_text_for_voice(reply) == (
+        "Summary Here are the key points: Install with pip Read the guide "
+        "That's 100 percent of it and you're done to enjoy!"
+    )